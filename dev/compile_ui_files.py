@@ -0,0 +1,69 @@
+# coding=utf-8
+"""
+Created on 15.10.2026
+
+Potku is a graphical user interface for analyzation and
+visualization of measurement data collected from a ToF-ERD
+telescope. For physics calculations Potku uses external
+analyzation components.
+Copyright (C) 2026 Potku developers
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (file named 'LICENCE').
+"""
+
+__author__ = "Potku developers"
+__version__ = "2.0"
+
+import sys
+
+from pathlib import Path
+
+from PyQt5 import uic
+
+"""
+Script for compiling the .ui files in ./ui_files into Python modules. The
+modules are written to ./ui_files/generated and are used by
+widgets.gui_utils.load_ui instead of parsing the .ui files when Potku is
+running. A generated module is only used if it is newer than its .ui file, so
+the script has to be run again after a .ui file has been modified. The script
+is run before bundling Potku with PyInstaller.
+"""
+
+root_directory = Path(__file__).resolve().parent.parent
+ui_directory = root_directory / "ui_files"
+output_directory = ui_directory / "generated"
+
+
+def compile_ui_files() -> int:
+    """Compiles all .ui files into Python modules.
+
+    Returns:
+        number of files that could not be compiled
+    """
+    output_directory.mkdir(exist_ok=True)
+    failed = 0
+    for ui_file in sorted(ui_directory.glob("*.ui")):
+        output_file = output_directory / f"{ui_file.stem}.py"
+        try:
+            with output_file.open("w", encoding="utf-8") as file:
+                uic.compileUi(str(ui_file), file)
+        except Exception as e:
+            print(f"Failed to compile {ui_file.name}: {e}")
+            output_file.unlink(missing_ok=True)
+            failed += 1
+    return failed
+
+
+if __name__ == "__main__":
+    sys.exit(compile_ui_files())
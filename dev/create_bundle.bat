@@ -37,6 +37,10 @@ cd %root_dir%
 echo(
 echo [92mInstalling and running PyInstaller[0m
 echo(
+echo [92mCompiling .ui files[0m
+echo(
+python dev\compile_ui_files.py || (echo [91mCompiling .ui files failed[0m && goto :error)
+
 pip install pyinstaller
 pyinstaller -y --clean potku.spec || (echo [91mPyInstaller failed[0m && goto :error)
 
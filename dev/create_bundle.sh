@@ -45,6 +45,10 @@ echo
 echo -e "${GREEN}Installing and running PyInstaller${NC}"
 echo
 
+echo -e "${GREEN}Compiling .ui files${NC}"
+echo
+python dev/compile_ui_files.py || exit 1
+
 pip install pyinstaller
 pyinstaller -y --clean --windowed potku.spec || exit 1
 
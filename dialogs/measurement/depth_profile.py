@@ -29,12 +29,17 @@ __author__ = "Jarkko Aalto \n Timo Konu \n Samuli Kärkkäinen " \
              "Samuel Kaiponen \n Heta Rekilä \n Sinikka Siironen"
 __version__ = "2.0"
 
+import threading
+
+from collections import OrderedDict
 from pathlib import Path
+from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
 
+from PyQt5 import QtCore
 from PyQt5 import QtWidgets
-from PyQt5 import uic
 from PyQt5.QtCore import QLocale
 
 import dialogs.dialog_functions as df
@@ -42,16 +47,21 @@ import modules.cut_file as cut_file
 import modules.depth_files as depth_files
 import widgets.binding as bnd
 import widgets.gui_utils as gutils
+from modules.detector import Detector
 from modules.element import Element
 from modules.enums import DepthProfileUnit
 from modules.global_settings import GlobalSettings
 from modules.measurement import Measurement
 from modules.observing import ProgressReporter
+from modules.observing import ThrottledReporter
+from modules.profile import Profile
 from widgets.base_tab import BaseTab
 from widgets.gui_utils import StatusBarHandler
 from widgets.matplotlib.measurement.depth_profile import \
     MatplotlibDepthProfileWidget
 
+_C_LOCALE = QLocale.c()
+
 
 class DepthProfileDialog(QtWidgets.QDialog):
     """
@@ -60,7 +70,7 @@ class DepthProfileDialog(QtWidgets.QDialog):
     # TODO replace these global variables with PropertySavingWidget.
     #   These should not be mutated because they are (static) class variables
     #   instead of member variables.
-    checked_cuts = {}
+    checked_cuts = OrderedDict()
     x_unit = DepthProfileUnit.ATOMS_PER_SQUARE_CM
     line_zero = False
     line_scale = False
@@ -86,6 +96,9 @@ class DepthProfileDialog(QtWidgets.QDialog):
     reference_density = bnd.bind("sbox_reference_density")
     x_axis_units = bnd.bind("group_x_axis_units")
 
+    # Maximum number of measurements whose cut selections are remembered
+    MAX_CHECKED_CUTS = 64
+
     def __init__(self, parent: BaseTab, measurement: Measurement,
                  global_settings: GlobalSettings,
                  statusbar: Optional[QtWidgets.QStatusBar] = None):
@@ -98,7 +111,8 @@ class DepthProfileDialog(QtWidgets.QDialog):
             statusbar: a QStatusBar object
         """
         super().__init__()
-        uic.loadUi(gutils.get_ui_dir() / "ui_depth_profile_params.ui", self)
+        gutils.load_ui(
+            gutils.get_ui_dir() / "ui_depth_profile_params.ui", self)
 
         # Basic stuff
         self.parent = parent
@@ -109,33 +123,26 @@ class DepthProfileDialog(QtWidgets.QDialog):
         self.OKButton.clicked.connect(self._accept_params)
         self.cancelButton.clicked.connect(self.close)
 
-        locale = QLocale.c()
-        self.spin_systerr.setLocale(locale)
-        self.sbox_reference_density.setLocale(locale)
+        self.spin_systerr.setLocale(_C_LOCALE)
+        self.sbox_reference_density.setLocale(_C_LOCALE)
 
         m_name = self.measurement.name
-        if m_name not in DepthProfileDialog.checked_cuts:
-            DepthProfileDialog.checked_cuts[m_name] = set()
 
         gutils.fill_cuts_treewidget(
             self.measurement,
             self.treeWidget.invisibleRootItem(),
             use_elemloss=True)
-        self.used_cuts = DepthProfileDialog.checked_cuts[m_name]
+        self.used_cuts = DepthProfileDialog.checked_cuts.get(
+            m_name, frozenset())
 
         self._update_label()
         self.treeWidget.itemClicked.connect(self._update_label)
 
         gutils.set_btn_group_data(self.group_x_axis_units, DepthProfileUnit)
         self.x_axis_units = DepthProfileDialog.x_unit
-        if self.x_axis_units == DepthProfileUnit.NM:
-            self._show_reference_density()
-        else:
-            self._hide_reference_density()
-
-        self.radioButtonNm.clicked.connect(self._show_reference_density)
-        self.radioButtonAtPerCm2.clicked.connect(
-            self._hide_reference_density)
+        self._x_unit = self.x_axis_units
+        self._update_reference_density_visibility()
+        self.group_x_axis_units.buttonToggled.connect(self._x_unit_toggled)
 
         self.systematic_error = DepthProfileDialog.systerr
 
@@ -147,13 +154,31 @@ class DepthProfileDialog(QtWidgets.QDialog):
 
         self.cross_sections = global_settings.get_cross_sections()
 
-        self._show_measurement_settings()
-        self._show_efficiency_files()
+        detector, _, _, profile, _ = self.measurement.get_used_settings()
+        self._show_measurement_settings(detector, profile)
+        self._show_efficiency_files(detector)
         # Does not work correctly if self is replaced with DepthProfileDialog
         self.eff_files_str = self.used_efficiency_files
 
         self.exec_()
 
+    @classmethod
+    def set_checked_cuts(cls, m_name: str, cuts: Iterable[Path]):
+        """Remembers the cut files that were selected for the given
+        measurement. Only the selections of the most recently used
+        measurements are kept.
+
+        Args:
+            m_name: name of the measurement
+            cuts: selected cut files
+        """
+        cuts = frozenset(cuts)
+        if cls.checked_cuts.get(m_name) != cuts:
+            cls.checked_cuts[m_name] = cuts
+        cls.checked_cuts.move_to_end(m_name)
+        while len(cls.checked_cuts) > cls.MAX_CHECKED_CUTS:
+            cls.checked_cuts.popitem(last=False)
+
     def _update_label(self):
         if len(self.used_cuts) <= 1:
             self.label_warning_text.setText('')
@@ -204,21 +229,24 @@ class DepthProfileDialog(QtWidgets.QDialog):
         self.status_msg = ""
         sbh = StatusBarHandler(self.statusbar)
         sbh.reporter.report(10)
+        # Once the depth profile widget has been created, it reports the rest
+        # of the progress as the depth files are generated in the background
+        progress_passed = False
 
         try:
             output_dir = self.measurement.get_depth_profile_dir()
 
             # Get the filepaths of the selected items
             used_cuts = self.used_cuts
-            DepthProfileDialog.checked_cuts[self.measurement.name] = set(
-                used_cuts)
+            DepthProfileDialog.set_checked_cuts(
+                self.measurement.name, used_cuts)
             # TODO could take care of RBS selection here
             elements = [
                 Element.from_string(fp.name.split(".")[1])
                 for fp in used_cuts
             ]
 
-            x_unit = self.x_axis_units
+            x_unit = self._x_unit
 
             DepthProfileDialog.x_unit = x_unit
             DepthProfileDialog.line_zero = self.show_zero_line
@@ -250,10 +278,9 @@ class DepthProfileDialog(QtWidgets.QDialog):
                     DepthProfileDialog.line_scale, DepthProfileDialog.systerr,
                     DepthProfileDialog.eff_files_str,
                     progress=sbh.reporter.get_sub_reporter(
-                        lambda x: 30 + 0.6 * x
-                    ))
-
-                sbh.reporter.report(90)
+                        lambda x: 30 + 0.7 * x
+                    ), status_bar_handler=sbh)
+                progress_passed = True
 
                 icon = self.parent.icon_manager.get_icon(
                     "depth_profile_icon_2_16.png")
@@ -268,35 +295,47 @@ class DepthProfileDialog(QtWidgets.QDialog):
                         f"profiles: {e}"
             self.measurement.log_error(error_log)
         finally:
-            sbh.reporter.report(100)
+            if not progress_passed:
+                sbh.reporter.report(100)
 
-    def _show_reference_density(self):
-        """
-        Add a filed for modifying the reference density.
-        """
-        self.label_reference_density.setVisible(True)
-        self.sbox_reference_density.setVisible(True)
+    def _x_unit_toggled(self, button: QtWidgets.QAbstractButton,
+                        checked: bool):
+        """Keeps track of the selected x axis unit.
 
-    def _hide_reference_density(self):
+        Args:
+            button: toggled button
+            checked: whether the button was checked or unchecked
         """
-        Remove reference density form dialog if it is there.
+        if checked:
+            self._x_unit = button.data_item
+            self._update_reference_density_visibility()
+
+    def _update_reference_density_visibility(self):
+        """Shows the field for modifying the reference density if the x axis
+        unit is nanometers, otherwise hides it.
         """
-        self.label_reference_density.setVisible(False)
-        self.sbox_reference_density.setVisible(False)
+        visible = self._x_unit == DepthProfileUnit.NM
+        self.label_reference_density.setVisible(visible)
+        self.sbox_reference_density.setVisible(visible)
 
-    def _show_efficiency_files(self):
+    def _show_efficiency_files(self, detector: Detector):
         """Update efficiency files to UI which are used.
+
+        Args:
+            detector: detector used by the measurement
         """
-        detector, *_ = self.measurement.get_used_settings()
         self.used_efficiency_files = df.get_efficiency_text_tree(
             self.treeWidget, detector)
 
-    def _show_measurement_settings(self):
+    def _show_measurement_settings(self, detector: Detector,
+                                   profile: Profile):
         """Show some important setting values in the depth profile parameter
         dialog for the user.
-        """
-        detector, _, _, profile, _ = self.measurement.get_used_settings()
 
+        Args:
+            detector: detector used by the measurement
+            profile: profile used by the measurement
+        """
         self.tof_slope = detector.tof_slope
         self.tof_offset = detector.tof_offset
         self.depth_stop = profile.depth_step_for_stopping
@@ -307,6 +346,63 @@ class DepthProfileDialog(QtWidgets.QDialog):
         self.reference_density = profile.reference_density
 
 
+# Workers that write to the same output directory are run one at a time
+_OUTPUT_DIR_LOCKS: Dict[Path, threading.Lock] = {}
+_OUTPUT_DIR_LOCKS_LOCK = threading.Lock()
+
+
+def _get_output_dir_lock(output_dir: Path) -> threading.Lock:
+    """Returns the lock that guards the given depth file directory.
+    """
+    with _OUTPUT_DIR_LOCKS_LOCK:
+        return _OUTPUT_DIR_LOCKS.setdefault(
+            Path(output_dir).resolve(), threading.Lock())
+
+
+class _DepthFileWorker(QtCore.QRunnable):
+    """Generates depth files in a thread pool. Emits finished signal when
+    the files are ready or error signal if the generation fails. If another
+    worker is writing to the same output directory, the worker waits for it
+    to finish first.
+    """
+    class Signaller(QtCore.QObject):
+        # Helper class for signalling the end of the work to the main thread
+        finished = QtCore.pyqtSignal()
+        error = QtCore.pyqtSignal(str)
+
+    def __init__(self, cut_files: List[Path], output_dir: Path,
+                 measurement: Measurement,
+                 progress: Optional[ProgressReporter] = None):
+        """Inits a new _DepthFileWorker.
+
+        Args:
+            cut_files: cut files used to generate the depth files
+            output_dir: directory where depth files are written to
+            measurement: a Measurement object
+            progress: a ProgressReporter object
+        """
+        super().__init__()
+        self.signaller = self.Signaller()
+        self._cut_files = cut_files
+        self._output_dir = output_dir
+        self._measurement = measurement
+        self._progress = progress
+
+    def run(self):
+        """Generates the depth files.
+        """
+        try:
+            with _get_output_dir_lock(self._output_dir):
+                depth_files.generate_depth_files(
+                    self._cut_files, self._output_dir, self._measurement,
+                    progress=self._progress
+                )
+        except Exception as e:
+            self.signaller.error.emit(str(e))
+        else:
+            self.signaller.finished.emit()
+
+
 class DepthProfileWidget(QtWidgets.QWidget):
     """Depth Profile widget which is added to measurement tab.
     """
@@ -317,7 +413,8 @@ class DepthProfileWidget(QtWidgets.QWidget):
                  line_zero: bool, used_eff: bool, line_scale: bool,
                  systematic_error: float,
                  eff_files_str: Optional[str],
-                 progress: Optional[ProgressReporter] = None):
+                 progress: Optional[ProgressReporter] = None,
+                 status_bar_handler: Optional[StatusBarHandler] = None):
         """Inits widget.
 
         Args:
@@ -331,13 +428,23 @@ class DepthProfileWidget(QtWidgets.QWidget):
             line_scale: A boolean representing if horizontal line is drawn at 
                         the defined depth scale.
             systematic_error: A double representing systematic error.
+            eff_files_str: efficiency files shown in the graph.
+            progress: a ProgressReporter object
+            status_bar_handler: StatusBarHandler whose progress bar the
+                progress is reported to. It is kept alive until the graph
+                has been created.
         """
+        super().__init__()
+        self.parent = parent
+        self.measurement: Measurement = parent.obj
+        self.matplotlib = None
+        self._worker = None
+        self._progress = progress
+        self._status_bar_handler = status_bar_handler
+        self._closed = False
         try:
-            super().__init__()
-            uic.loadUi(gutils.get_ui_dir() / "ui_depth_profile.ui", self)
+            gutils.load_ui(gutils.get_ui_dir() / "ui_depth_profile.ui", self)
 
-            self.parent = parent
-            self.measurement: Measurement = parent.obj
             self.output_dir = output_dir
             self.elements = elements
             self.x_units = x_units
@@ -349,43 +456,86 @@ class DepthProfileWidget(QtWidgets.QWidget):
             self._systematic_error = systematic_error
 
             if progress is not None:
-                sub_progress = progress.get_sub_reporter(lambda x: 0.5 * x)
+                # Depth file generation reports progress frequently from the
+                # worker thread. Each report is a queued update of the
+                # progress bar, so they are throttled to keep the GUI
+                # responsive.
+                sub_progress = ThrottledReporter(
+                    progress.get_sub_reporter(lambda x: 0.5 * x).report)
             else:
                 sub_progress = None
 
-            detector, _, _, profile, _ = self.measurement.get_used_settings()
+            detector, _, _, self._profile, _ = \
+                self.measurement.get_used_settings()
             if self._eff_files_str is None:
                 cuts = self.measurement.get_cut_files()[0]  # Ignore element losses
                 self._eff_files_str = df.get_efficiency_text_cuts(cuts, detector)
 
-            depth_files.generate_depth_files(
-                self.use_cuts, self.output_dir, self.measurement,
-                progress=sub_progress
-            )
-
-            if progress is not None:
-                progress.report(50)
-
             # Check for RBS selections.
             rbs_list = cut_file.get_rbs_selections(self.use_cuts)
-
-            for rbs in rbs_list:
-                # Search and replace instances of Beam element with scatter
-                # elements.
-                # When loading request, the scatter element is already
-                # replaced. This is essentially done only when creating
-                # a new Depth Profile graph.
-                # TODO seems overly complicated. This stuff should be sorted
-                #  before initializing the widget
+            self._rbs_list = rbs_list
+
+            # Search and replace instances of Beam element with scatter
+            # elements.
+            # When loading request, the scatter element is already
+            # replaced. This is essentially done only when creating
+            # a new Depth Profile graph.
+            # TODO seems overly complicated. This stuff should be sorted
+            #  before initializing the widget
+            scatter_elements = {}
+            for rbs, scatter_element in rbs_list.items():
                 element = Element.from_string(rbs.split(".")[0])
+                scatter_elements.setdefault(element, scatter_element)
+            if scatter_elements:
                 for i, elem in enumerate(elements):
-                    if elem == element:
-                        elements[i] = rbs_list[rbs]
+                    elements[i] = scatter_elements.get(elem, elem)
+
+            # Depth files are generated in a worker thread so that the GUI
+            # stays responsive. The graph is created once they are ready.
+            self._worker = _DepthFileWorker(
+                self.use_cuts, self.output_dir, self.measurement,
+                progress=sub_progress)
+            self._worker.signaller.finished.connect(self._create_graph)
+            self._worker.signaller.error.connect(self._on_worker_error)
+            QtCore.QThreadPool.globalInstance().start(self._worker)
+        except Exception as e:
+            self._on_worker_error(str(e))
+
+    def _on_worker_error(self, error: str):
+        """Logs an error that occurred while creating the depth profile.
+        """
+        self._worker = None
+        try:
+            msg = f"Could not create Depth Profile graph: {error}"
+            self.measurement.log_error(msg)
+        finally:
+            self._finish_progress()
+
+    def _finish_progress(self):
+        """Reports the end of depth profile creation. This also removes the
+        progress bar of the status bar handler, after which the handler is
+        released.
+        """
+        if self._progress is not None:
+            self._progress.report(100)
+        self._status_bar_handler = None
+
+    def _create_graph(self):
+        """Creates the depth profile graph after the depth files have been
+        generated.
+        """
+        self._worker = None
+        progress = self._progress
+        try:
+            if self._closed:
+                return
+            if progress is not None:
+                progress.report(50)
 
             if self._line_scale_shown:
                 depth_scale = (
-                    profile.depth_for_concentration_from,
-                    profile.depth_for_concentration_to
+                    self._profile.depth_for_concentration_from,
+                    self._profile.depth_for_concentration_to
                 )
             else:
                 depth_scale = None
@@ -397,7 +547,7 @@ class DepthProfileWidget(QtWidgets.QWidget):
                 sub_progress = None
 
             self.matplotlib = MatplotlibDepthProfileWidget(
-                self, self.output_dir, self.elements, rbs_list,
+                self, self.output_dir, self.elements, self._rbs_list,
                 icon_manager=self.parent.icon_manager,
                 selection_colors=self.measurement.selector.get_colors(),
                 depth_scale=depth_scale, x_units=self.x_units,
@@ -408,22 +558,27 @@ class DepthProfileWidget(QtWidgets.QWidget):
         except Exception as e:
             msg = f"Could not create Depth Profile graph: {e}"
             self.measurement.log_error(msg)
-            if hasattr(self, "matplotlib"):
+            if self.matplotlib is not None:
                 self.matplotlib.delete()
+                self.matplotlib = None
         finally:
-            if progress is not None:
-                progress.report(100)
+            self._finish_progress()
 
     def delete(self):
         """Delete variables and do clean up.
         """
-        self.matplotlib.delete()
-        self.matplotlib = None
+        if self.matplotlib is not None:
+            self.matplotlib.delete()
+            self.matplotlib = None
         self.close()
 
     def closeEvent(self, evnt):
         """Reimplemented method when closing widget.
         """
+        # Graph is not created if depth files are still being generated
+        self._closed = True
+        if self._worker is not None:
+            self._finish_progress()
         self.parent.depth_profile_widget = None
         file = Path(self.measurement.directory, self.save_file)
         try:
@@ -440,16 +595,17 @@ class DepthProfileWidget(QtWidgets.QWidget):
 
         file = Path(self.measurement.get_depth_profile_dir(), self.save_file)
 
+        lines = [
+            f"{output_dir}",
+            "\t".join(str(element) for element in self.elements),
+            "\t".join(str(cut) for cut in self.use_cuts),
+            f"{self.x_units}",
+            f"{self._line_zero_shown}",
+            f"{self._line_scale_shown}",
+            f"{self._systematic_error}",
+        ]
         with file.open("w") as fh:
-            fh.write("{0}\n".format(str(output_dir)))
-            fh.write("{0}\n".format("\t".join([
-                str(element) for element in self.elements])))
-            fh.write("{0}\n".format("\t".join([
-                str(cut) for cut in self.use_cuts])))
-            fh.write("{0}\n".format(self.x_units))
-            fh.write("{0}\n".format(self._line_zero_shown))
-            fh.write("{0}\n".format(self._line_scale_shown))
-            fh.write("{0}".format(self._systematic_error))
+            fh.write("\n".join(lines))
 
     def update_use_cuts(self):
         """
@@ -43,11 +43,13 @@ from modules.element import Element
 from modules.layer import Layer
 
 from PyQt5 import QtWidgets
-from PyQt5 import uic
 from PyQt5.QtCore import QLocale
 
 from math import isclose
 
+_C_LOCALE = QLocale.c()
+
+
 class LayerPropertiesDialog(QtWidgets.QDialog, bnd.PropertyTrackingWidget,
                             metaclass=gutils.QtABCMeta):
     """Dialog for adding a new layer or editing an existing one.
@@ -68,7 +70,7 @@ class LayerPropertiesDialog(QtWidgets.QDialog, bnd.PropertyTrackingWidget,
             first_layer: Whether the dialog is used to add the first layer.
         """
         super().__init__()
-        uic.loadUi(gutils.get_ui_dir() / "ui_layer_dialog.ui", self)
+        gutils.load_ui(gutils.get_ui_dir() / "ui_layer_dialog.ui", self)
 
         self.tab = tab
         self.layer = layer
@@ -103,8 +105,8 @@ class LayerPropertiesDialog(QtWidgets.QDialog, bnd.PropertyTrackingWidget,
 
         self.__close = True
 
-        self.thicknessEdit.setLocale(QLocale.c())
-        self.densityEdit.setLocale(QLocale.c())
+        self.thicknessEdit.setLocale(_C_LOCALE)
+        self.densityEdit.setLocale(_C_LOCALE)
 
         if modify:
             self.groupBox_2.hide()
@@ -314,7 +316,7 @@ class ElementLayout(QtWidgets.QVBoxLayout):
         self.amount_spinbox.setMaximum(1)
 
         self.amount_spinbox.setDecimals(3)
-        self.amount_spinbox.setLocale(QLocale.c())
+        self.amount_spinbox.setLocale(_C_LOCALE)
         self.amount_spinbox.setFixedWidth(90)
 
         self.delete_button = QtWidgets.QPushButton("")
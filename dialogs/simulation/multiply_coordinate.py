@@ -52,11 +52,13 @@ class MultiplyCoordinateDialog(QtWidgets.QDialog):
         locale = QLocale.c()
         self.multiplierSpinBox.setLocale(locale)
 
+        # Clipboard text is parsed only once, when the dialog is opened
         try:
-            float(self.ratio_str)
+            self.clipboard_multiplier = float(self.ratio_str)
 
             self.ratioLabel.setText(self.ratio_str)
         except ValueError:
+            self.clipboard_multiplier = None
             self.ratioLabel.setText("None")
             self.ratioLabel.setEnabled(False)
             self.clipboardButton.setChecked(False)
@@ -78,7 +80,7 @@ class MultiplyCoordinateDialog(QtWidgets.QDialog):
         if self.customButton.isChecked():
             self.used_multiplier = round(self.multiplierSpinBox.value(), 3)
         else:
-            self.used_multiplier = float(self.ratioLabel.text())
+            self.used_multiplier = self.clipboard_multiplier
         self.close()
 
     def switch_to_clipboard_value(self):
@@ -31,6 +31,10 @@ __author__ = "Jarkko Aalto \n Timo Konu \n Samuli Kärkkäinen \n " \
 __version__ = "2.0"
 
 import re
+import functools
+
+from typing import Optional
+from typing import Tuple
 
 from . import masses as masses
 
@@ -66,34 +70,7 @@ class Element(MCERDParameterContainer):
         Return:
             Element object.
         """
-        if element_str == 'SUM':
-            m = re.match(r"(?P<isotope>[0-9]{0,3})(?P<symbol>[a-zA-Z]{1,3})"
-                     r"(\s(?P<amount>\d*(\.?\d+)?))?", element_str.strip())
-        else:
-            m = re.match(r"(?P<isotope>[0-9]{0,3})(?P<symbol>[a-zA-Z]{1,2})"
-                     r"(\s(?P<amount>\d*(\.?\d+)?))?", element_str.strip())
-        if m:
-            symbol = m.group("symbol")
-            isotope = m.group("isotope")
-            amount = m.group("amount")
-
-            if isotope and amount:
-                return cls(symbol, int(isotope), float(amount))
-            elif isotope:
-                return cls(symbol, int(isotope))
-            elif amount:
-                return cls(symbol, None, float(amount))
-            else:
-                return cls(symbol)
-        else:
-            # FIXME crashes here. Steps:
-            #           - open sample request from JYU web site
-            #           - redo cuts by saving them
-            #           - create a composition change graph or energy spectra
-            #           - crashes here because of an empty string
-            raise ValueError(
-                f"Could not intialize an Element from the given "
-                f"string: {element_str}")
+        return cls(*_parse_element_str(element_str))
 
     def __str__(self):
         """Transform element into string.
@@ -274,4 +251,42 @@ class Element(MCERDParameterContainer):
         symbol = data["symbol"]
         isotope = data["isotope"]
         amount = data["amount"]
-        return cls(symbol, isotope, amount)
\ No newline at end of file
+        return cls(symbol, isotope, amount)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_element_str(element_str: str) \
+        -> Tuple[str, Optional[int], float]:
+    """Parses the symbol, isotope and amount of an element from a string.
+    Results are cached as the same element strings are parsed repeatedly.
+    Elements are mutable, so the cache stores the parsed values instead of
+    Element objects.
+    """
+    if element_str == 'SUM':
+        m = re.match(r"(?P<isotope>[0-9]{0,3})(?P<symbol>[a-zA-Z]{1,3})"
+                 r"(\s(?P<amount>\d*(\.?\d+)?))?", element_str.strip())
+    else:
+        m = re.match(r"(?P<isotope>[0-9]{0,3})(?P<symbol>[a-zA-Z]{1,2})"
+                 r"(\s(?P<amount>\d*(\.?\d+)?))?", element_str.strip())
+    if m:
+        symbol = m.group("symbol")
+        isotope = m.group("isotope")
+        amount = m.group("amount")
+
+        if isotope and amount:
+            return symbol, int(isotope), float(amount)
+        elif isotope:
+            return symbol, int(isotope), 0.0
+        elif amount:
+            return symbol, None, float(amount)
+        else:
+            return symbol, None, 0.0
+    else:
+        # FIXME crashes here. Steps:
+        #           - open sample request from JYU web site
+        #           - redo cuts by saving them
+        #           - create a composition change graph or energy spectra
+        #           - crashes here because of an empty string
+        raise ValueError(
+            f"Could not intialize an Element from the given "
+            f"string: {element_str}")
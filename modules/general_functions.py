@@ -150,19 +150,18 @@ def remove_matching_files(directory: Path, exts: Optional[Set[str]] = None,
     """
     # TODO change the filter function so that it takes the Path as an argument,
     #   not just file name.
-    def _filter_func(fp: Path):
+    def _filter_func(name: str):
         if exts is not None and filter_func is None:
-            return fp.suffix in exts
+            return Path(name).suffix in exts
         if exts is None:
-            return filter_func(fp.name)
-        return fp.suffix in exts and filter_func(fp.name)
+            return filter_func(name)
+        return Path(name).suffix in exts and filter_func(name)
 
     try:
         with os.scandir(directory) as sdir:
-            for entry in sdir:
-                path = Path(entry.path)
-                if _filter_func(path):
-                    remove_files(path)
+            remove_files(*(
+                Path(entry.path) for entry in sdir if _filter_func(entry.name)
+            ))
     except OSError:
         # Directory not found (or directory is a file), nothing to do
         pass
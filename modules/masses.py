@@ -33,6 +33,7 @@ __author__ = "Jarkko Aalto \n Timo Konu \n Samuli Kärkkäinen \n " \
 __version__ = "2.0"
 
 from collections import defaultdict
+from functools import lru_cache
 
 from . import general_functions as gf
 from .parsing import CSVParser
@@ -109,9 +110,13 @@ def find_mass_of_isotope(symbol, isotope):
             return isotope[MASS_KEY] / 1_000_000
 
 
+@lru_cache(maxsize=256)
 def get_standard_isotope(symbol):
     """Calculate standard element weight.
 
+    Results are cached as the isotope data does not change after it has been
+    read from masses.dat.
+
     Args:
         symbol: a string symbol representing an element, e.g. 'He'
 
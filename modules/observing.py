@@ -27,6 +27,7 @@ __version__ = "2.0"
 
 import weakref
 import sys
+import time
 
 from reactivex import operators as ops
 
@@ -82,6 +83,49 @@ class ProgressReporter:
             lambda value: self.report(progress_callback(value)))
 
 
+class ThrottledReporter(ProgressReporter):
+    """ProgressReporter that drops reports that arrive too frequently.
+
+    A report is only forwarded if the integer part of the value has changed
+    and enough time has passed since the previously forwarded report. Values
+    of 100 or more are always forwarded so that the end of the process is
+    never missed.
+    """
+
+    def __init__(self, progress_callback, min_interval: float = 0.05):
+        """Initializes a new ThrottledReporter.
+
+        Args:
+            progress_callback: function that is invoked when progress is
+                reported.
+            min_interval: minimum time in seconds between two forwarded
+                reports.
+        """
+        super().__init__(progress_callback)
+        self._min_interval = min_interval
+        self._last_value = None
+        self._last_time = None
+
+    def report(self, value):
+        """Reports the value of progress if the previous report was not
+        too recent.
+
+        Args:
+            value: progress value to report
+        """
+        if value < 100:
+            int_value = int(value)
+            if int_value == self._last_value:
+                return
+            now = time.monotonic()
+            if self._last_time is not None and \
+                    now - self._last_time < self._min_interval:
+                return
+            self._last_value = int_value
+            self._last_time = now
+        super().report(value)
+
+
 class Observable:
     """Observables are objects that publish messages to subscribed
     observers by invoking their receive method.
@@ -34,6 +34,7 @@ import itertools
 import time
 
 from pathlib import Path
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -86,6 +87,9 @@ class RecoilElement(MCERDParameterContainer, Serializable):
         #  list, although this depends on the number of elements in the list.
         #  A linked list would make finding neighbors faster.
         self._points = sorted(points)
+        # Indexes of the points in the points list by the ids of the points.
+        # Built when needed and cleared when the list changes.
+        self._point_indexes: Optional[Dict[int, int]] = None
         self.points_backlog = []
         # This is out of bounds if no undo is done, telss the index of the
         # next points to be added
@@ -239,6 +243,7 @@ class RecoilElement(MCERDParameterContainer, Serializable):
         Change the points list reference to another list.
         """
         self._points = self.points_backlog[self.points_backlog_i_add - 1]
+        self._point_indexes = None
         self.points_backlog_i_add -= 1
 
     def change_points_to_next(self):
@@ -246,6 +251,7 @@ class RecoilElement(MCERDParameterContainer, Serializable):
         Change the points list reference to another list.
         """
         self._points = self.points_backlog[self.points_backlog_i_add + 1]
+        self._point_indexes = None
         self.points_backlog_i_add += 1
 
     def delete_backlog(self):
@@ -309,6 +315,7 @@ class RecoilElement(MCERDParameterContainer, Serializable):
     def _sort_points(self):
         """Sorts the points in ascending order by their x coordinate."""
         self._points.sort()
+        self._point_indexes = None
 
     def get_xs(self) -> List[float]:
         """Returns a list of the x coordinates of the points."""
@@ -369,12 +376,45 @@ class RecoilElement(MCERDParameterContainer, Serializable):
         """Removes the given point.
         """
         self._points.remove(point)
+        self._point_indexes = None
+
+    def remove_points(self, points: List[Point]):
+        """Removes all the given points with a single pass over the points.
+        """
+        remove_ids = {id(point) for point in points}
+        kept_points = [p for p in self._points if id(p) not in remove_ids]
+        if len(self._points) - len(kept_points) != len(remove_ids):
+            # Some of the points are not in the list as such, so they are
+            # removed one by one by their values like in remove_point
+            for point in points:
+                self.remove_point(point)
+            return
+        # List is modified in place as it may be shared with the backlog
+        self._points[:] = kept_points
+        self._point_indexes = None
+
+    def _index_of(self, point: Point) -> int:
+        """Returns the index of the given point in the points list.
+
+        Points in the list are found by their identity without comparing
+        them to every point before them. Other points are searched by value
+        like list.index does.
+        """
+        if self._point_indexes is None:
+            self._point_indexes = {
+                id(p): i for i, p in enumerate(self._points)
+            }
+        ind = self._point_indexes.get(id(point))
+        if ind is not None and ind < len(self._points) and \
+                self._points[ind] is point:
+            return ind
+        return self._points.index(point)
 
     def get_left_neighbor(self, point: Point) -> Optional[Point]:
         """Returns the point whose x coordinate is closest to but
         less than the given point's.
         """
-        ind = self._points.index(point)
+        ind = self._index_of(point)
         if ind == 0:
             return None
         else:
@@ -384,7 +424,7 @@ class RecoilElement(MCERDParameterContainer, Serializable):
         """Returns the point whose x coordinate is closest to but
         greater than the given point's.
         """
-        ind = self._points.index(point)
+        ind = self._index_of(point)
         if ind == len(self._points) - 1:
             return None
         else:
@@ -400,7 +440,7 @@ class RecoilElement(MCERDParameterContainer, Serializable):
         Return:
             left and right neighbour as a tuple
         """
-        ind = self._points.index(point)
+        ind = self._index_of(point)
 
         if ind == 0:
             ln = None
@@ -532,7 +532,11 @@ class Potku(QtWidgets.QMainWindow):
             tab.histogram.matplotlib.delete()
             tab.elemental_losses_widget.matplotlib.delete()
             tab.energy_spectrum_widget.matplotlib.delete()
-            tab.depth_profile_widget.matplotlib.delete()
+            # Depth profile graph is missing while its depth files are still
+            # being generated
+            depth_widget = tab.depth_profile_widget
+            if depth_widget is not None and depth_widget.matplotlib is not None:
+                depth_widget.matplotlib.delete()
 
             tab.mdiArea.closeAllSubWindows()
             del self.tab_widgets[tab.tab_id]
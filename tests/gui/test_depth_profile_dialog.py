@@ -24,15 +24,19 @@ along with this program (file named 'LICENCE').
 __author__ = "Juhani Sundell"
 __version__ = "2.0"
 
+import os
 import unittest
 import tests.gui
 import tests.mock_objects as mo
 
+from pathlib import Path
 from unittest.mock import Mock
 from unittest.mock import patch
 
 from modules.enums import CrossSection
+from modules.enums import DepthProfileUnit
 from dialogs.measurement.depth_profile import DepthProfileDialog
+from dialogs.measurement.depth_profile import _get_output_dir_lock
 
 
 class TestDialogInitialization(unittest.TestCase):
@@ -131,6 +135,56 @@ class TestDialogInitialization(unittest.TestCase):
         )
         dialog.close()
 
+    @patch("PyQt5.QtWidgets.QDialog.exec_")
+    def test_x_unit_selection(self, _):
+        dialog = DepthProfileDialog(
+            self.parent_widget,
+            self.measurement,
+            self.global_settings)
+
+        dialog.radioButtonNm.setChecked(True)
+        self.assertEqual(DepthProfileUnit.NM, dialog._x_unit)
+        self.assertFalse(dialog.sbox_reference_density.isHidden())
+
+        dialog.radioButtonAtPerCm2.setChecked(True)
+        self.assertEqual(
+            DepthProfileUnit.ATOMS_PER_SQUARE_CM, dialog._x_unit)
+        self.assertTrue(dialog.sbox_reference_density.isHidden())
+        dialog.close()
+
+
+class TestCheckedCuts(unittest.TestCase):
+    def setUp(self):
+        self.old_cuts = DepthProfileDialog.checked_cuts.copy()
+        DepthProfileDialog.checked_cuts.clear()
+
+    def tearDown(self):
+        DepthProfileDialog.checked_cuts.clear()
+        DepthProfileDialog.checked_cuts.update(self.old_cuts)
+
+    @patch.object(DepthProfileDialog, "MAX_CHECKED_CUTS", 2)
+    def test_least_recently_used_are_removed(self):
+        DepthProfileDialog.set_checked_cuts("m1", [Path("a")])
+        DepthProfileDialog.set_checked_cuts("m2", [Path("b")])
+        DepthProfileDialog.set_checked_cuts("m1", [Path("a")])
+        DepthProfileDialog.set_checked_cuts("m3", [Path("c")])
+
+        self.assertEqual({
+            "m1": frozenset([Path("a")]),
+            "m3": frozenset([Path("c")]),
+        }, dict(DepthProfileDialog.checked_cuts))
+
+
+class TestOutputDirLocks(unittest.TestCase):
+    def test_same_directory_has_same_lock(self):
+        relative = Path("depth_files")
+        absolute = Path(os.getcwd(), "depth_files")
+        self.assertIs(
+            _get_output_dir_lock(relative), _get_output_dir_lock(absolute))
+        self.assertIsNot(
+            _get_output_dir_lock(relative),
+            _get_output_dir_lock(Path("other_depth_files")))
+
 
 if __name__ == '__main__':
     unittest.main()
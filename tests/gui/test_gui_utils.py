@@ -137,3 +137,17 @@ class TestMinMaxHandlers(unittest.TestCase):
             sb = random.choice([spinbox1, spinbox2])
             sb.setValue(random.randint(0, 100))
             self.assertTrue(spinbox1.value() <= spinbox2.value())
+
+
+class TestLoadUi(unittest.TestCase):
+    def test_load_ui(self):
+        ui_file = gutils.get_ui_dir() / "ui_layer_dialog.ui"
+        w1 = QtWidgets.QDialog()
+        w2 = QtWidgets.QDialog()
+        gutils.load_ui(ui_file, w1)
+        gutils.load_ui(ui_file, w2)
+
+        self.assertIsInstance(w1.okButton, QtWidgets.QPushButton)
+        self.assertIsNot(w1.okButton, w2.okButton)
+        self.assertIs(gutils._get_ui_form_class(ui_file),
+                      gutils._get_ui_form_class(ui_file))
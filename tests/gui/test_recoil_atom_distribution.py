@@ -0,0 +1,87 @@
+# coding=utf-8
+"""
+Created on 15.10.2026
+
+Potku is a graphical user interface for analyzation and
+visualization of measurement data collected from a ToF-ERD
+telescope. For physics calculations Potku uses external
+analyzation components.
+Copyright (C) 2026 Potku developers
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (file named 'LICENCE').
+"""
+__author__ = "Potku developers"
+__author__ = "Potku developers"
+__version__ = "2.0"
+
+import unittest
+import tests.mock_objects as mo
+import tests.gui
+
+from unittest.mock import patch
+from unittest.mock import Mock
+from widgets.icon_manager import IconManager
+from widgets.simulation.target import TargetWidget
+
+from matplotlib.backend_bases import MouseEvent
+from PyQt5.QtWidgets import QToolButton
+
+
+class TestAreaWhileDragging(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(TargetWidget, "_save_target_and_recoils")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.widget = TargetWidget(
+            Mock(), mo.get_simulation(), mo.get_target(), IconManager(),
+            mo.get_global_settings(), auto_save=False)
+        self.addCleanup(self.widget.close)
+        self.rec_dist = self.widget.recoil_distribution_widget
+
+        elem_sim = mo.get_element_simulation()
+        self.rec_dist.add_element(
+            elem_sim.get_main_recoil().element, element_simulation=elem_sim)
+        # Points of the recoil are (1, 1) and (2, 2)
+        self.recoil = elem_sim.get_main_recoil()
+        self.recoil.widgets[0].radio_button.setChecked(True)
+        self.rec_dist.update_plot()
+
+        toolbar = self.rec_dist.mpl_toolbar
+        limits_btn = next(
+            btn for btn in toolbar.findChildren(QToolButton)
+            if btn.toolTip() == "Toggle recoil element specific limits")
+        limits_btn.click()
+        self.rec_dist.canvas.draw()
+
+    def send_mouse_event(self, name, x, y):
+        px, py = self.rec_dist.axes.transData.transform((x, y))
+        event = MouseEvent(name, self.rec_dist.canvas, px, py, button=1)
+        self.rec_dist.canvas.callbacks.process(name, event)
+
+    def get_area_text(self):
+        return self.rec_dist.anchored_box.get_child().get_text()
+
+    def test_area_is_updated_when_released_before_redraw(self):
+        self.assertEqual("Area: 1.5", self.get_area_text())
+
+        self.send_mouse_event("button_press_event", 1, 1)
+        self.send_mouse_event("motion_notify_event", 1, 1.5)
+        self.send_mouse_event("button_release_event", 1, 1.5)
+
+        self.assertEqual(((1, 2), (1.5, 2)), self.recoil.get_xs_and_ys())
+        self.assertEqual("Area: 1.75", self.get_area_text())
+
+
+if __name__ == '__main__':
+    unittest.main()
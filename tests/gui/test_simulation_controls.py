@@ -0,0 +1,85 @@
+# coding=utf-8
+"""
+Created on 15.10.2026
+
+Potku is a graphical user interface for analyzation and
+visualization of measurement data collected from a ToF-ERD
+telescope. For physics calculations Potku uses external
+analyzation components.
+Copyright (C) 2026 Potku developers
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (file named 'LICENCE').
+"""
+__author__ = "Potku developers"
+__version__ = "2.0"
+
+import unittest
+import tests.gui
+
+import widgets.simulation.controls as controls
+
+from unittest.mock import Mock
+from unittest.mock import patch
+
+from modules.observing import Observable
+from widgets.simulation.controls import LazySimulationControlsWidget
+
+from PyQt5 import QtWidgets
+
+
+class TestLazySimulationControls(unittest.TestCase):
+    def setUp(self):
+        self.element_simulation = Observable()
+        self.controls = QtWidgets.QWidget()
+        self.controls.on_next_handler = Mock()
+        self.controls.on_error_handler = Mock()
+        self.controls.on_completed_handler = Mock()
+        patcher = patch.object(
+            controls, "SimulationControlsWidget",
+            return_value=self.controls)
+        self.controls_cls = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.widget = LazySimulationControlsWidget(
+            self.element_simulation, Mock())
+
+    def test_controls_are_created_when_shown(self):
+        self.assertIsNone(self.widget.controls)
+        self.controls_cls.assert_not_called()
+
+        self.widget.show()
+        self.assertIs(self.controls, self.widget.controls)
+        self.controls_cls.assert_called_once()
+
+    def test_state_change_before_first_show(self):
+        self.element_simulation.on_next({"foo": 1})
+        self.element_simulation.on_completed({"foo": 2})
+
+        self.widget.show()
+        self.controls.on_next_handler.assert_not_called()
+        self.controls.on_completed_handler.assert_called_once_with(
+            {"foo": 2})
+
+    def test_error_before_first_show(self):
+        self.element_simulation.on_error("foo")
+
+        self.widget.show()
+        self.controls.on_error_handler.assert_called_once_with("foo")
+
+    def test_placeholder_unsubscribes_after_first_show(self):
+        self.assertEqual(1, self.element_simulation.get_observer_count())
+        self.widget.show()
+        self.assertEqual(0, self.element_simulation.get_observer_count())
+
+        self.element_simulation.on_completed({"foo": 3})
+        self.controls.on_completed_handler.assert_not_called()
@@ -61,6 +61,15 @@ class TestElement(unittest.TestCase):
         self.assertEqual(3, e.isotope)
         self.assertEqual(2, e.amount)
 
+    def test_from_string_returns_new_objects(self):
+        e1 = Element.from_string("4He 2")
+        e2 = Element.from_string("4He 2")
+        self.assertEqual(e1, e2)
+        self.assertIsNot(e1, e2)
+
+        e1.amount = 3
+        self.assertEqual(2, Element.from_string("4He 2").amount)
+
     def test_lt(self):
         elems = [
             Element.from_string("H"),
@@ -113,6 +113,12 @@ class TestMasses(unittest.TestCase):
         self.assertEqual(0, masses.get_standard_isotope("U"))
         self.assertEqual(0, masses.get_standard_isotope("foo"))
 
+    def test_get_st_mass_cached(self):
+        masses.get_standard_isotope.cache_clear()
+        st_mass = masses.get_standard_isotope("C")
+        self.assertEqual(st_mass, masses.get_standard_isotope("C"))
+        self.assertEqual(1, masses.get_standard_isotope.cache_info().hits)
+
     def test_get_most_common(self):
         elems = ["C", "He", "Mn", "Li"]
         for elem in elems:
@@ -33,6 +33,7 @@ import modules.observing as observing
 from modules.observing import Observable
 from modules.observing import Observer
 from modules.observing import ProgressReporter
+from modules.observing import ThrottledReporter
 from tests.mock_objects import MockObserver
 
 
@@ -235,6 +236,23 @@ class TestProgressReporting(unittest.TestCase):
 
         self.assertRaises(TypeError, lambda: sub_reporter.report(1))
 
+    def test_throttled_reporting(self):
+        reported = []
+        reporter = ThrottledReporter(reported.append, min_interval=60)
+        reporter.report(1)
+        reporter.report(1.5)
+        reporter.report(2)
+        self.assertEqual([1], reported)
+
+        reporter.report(100)
+        self.assertEqual([1, 100], reported)
+
+        reporter = ThrottledReporter(reported.append, min_interval=0)
+        reporter.report(1)
+        reporter.report(1.5)
+        reporter.report(2)
+        self.assertEqual([1, 100, 1, 2], reported)
+
 
 class TestRxOps(unittest.TestCase):
     def setUp(self):
@@ -204,6 +204,17 @@ class TestPoints(unittest.TestCase):
         self.assertRaises(
             ValueError, lambda: self.rec_elem.remove_point(self.p1))
 
+    def test_remove_points(self):
+        self.rec_elem.remove_points([self.p1, self.p3])
+        self.assertEqual([self.p2], self.rec_elem.get_points())
+        self.assertEqual((None, None), self.rec_elem.get_neighbors(self.p2))
+
+        self.rec_elem.remove_points([Point(self.p2_args)])
+        self.assertEqual([], self.rec_elem.get_points())
+
+        self.assertRaises(
+            ValueError, lambda: self.rec_elem.remove_points([self.p1]))
+
     def test_get_neighbours(self):
         ln, rn = self.rec_elem.get_neighbors(self.p1)
         self.assertIsNone(ln)
@@ -221,6 +232,19 @@ class TestPoints(unittest.TestCase):
         self.assertIs(ln, self.p1)
         self.assertIs(rn, self.p3)
 
+    def test_neighbours_after_modification(self):
+        self.assertIs(self.p2, self.rec_elem.get_right_neighbor(self.p1))
+
+        p4 = Point(0.5, 1)
+        self.rec_elem.add_point(p4)
+        self.assertIs(p4, self.rec_elem.get_right_neighbor(self.p1))
+        self.assertIs(p4, self.rec_elem.get_left_neighbor(self.p2))
+
+        self.rec_elem.remove_point(p4)
+        self.assertIs(self.p2, self.rec_elem.get_right_neighbor(self.p1))
+        self.assertRaises(
+            ValueError, lambda: self.rec_elem.get_neighbors(p4))
+
     def test_between_zeros(self):
         self.assertFalse(self.rec_elem.between_zeros(self.p1))
         self.assertTrue(self.rec_elem.between_zeros(self.p2))
@@ -0,0 +1,181 @@
+# coding=utf-8
+"""
+Created on 15.10.2026
+
+Potku is a graphical user interface for analyzation and
+visualization of measurement data collected from a ToF-ERD
+telescope. For physics calculations Potku uses external
+analyzation components.
+Copyright (C) 2026 Potku developers
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program (file named 'LICENCE').
+"""
+
+__author__ = "Potku developers"
+__version__ = "2.0"
+
+import hashlib
+import os
+import tempfile
+import unittest
+
+import tests.utils as utils
+
+from pathlib import Path
+from unittest.mock import patch
+
+
+class TestMD5Cache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file = Path(self.tmp_dir.name, "foo.txt")
+        self.file.write_bytes(b"foo")
+        self.expected = hashlib.md5(b"foo").hexdigest()
+
+        cache = dict(utils._MD5_CACHE)
+        utils._MD5_CACHE.clear()
+        self.addCleanup(utils._MD5_CACHE.update, cache)
+        self.addCleanup(utils._MD5_CACHE.clear)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def get_md5(self, *file_paths):
+        with patch.object(utils, "_calculate_md5_for_files",
+                          wraps=utils._calculate_md5_for_files) as calc:
+            checksum = utils.get_md5_for_files(file_paths)
+        return checksum, calc.call_count
+
+    def test_unchanged_file_is_hashed_once(self):
+        self.assertEqual((self.expected, 1), self.get_md5(self.file))
+        self.assertEqual((self.expected, 0), self.get_md5(self.file))
+
+    def test_relative_and_absolute_paths_share_cache(self):
+        self.get_md5(self.file)
+        old_wd = os.getcwd()
+        os.chdir(self.tmp_dir.name)
+        try:
+            self.assertEqual(
+                (self.expected, 0), self.get_md5(Path("foo.txt")))
+        finally:
+            os.chdir(old_wd)
+
+    def test_changed_modification_time_is_hashed_again(self):
+        self.get_md5(self.file)
+        stat = self.file.stat()
+        os.utime(self.file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertEqual((self.expected, 1), self.get_md5(self.file))
+
+    def test_changed_size_is_hashed_again(self):
+        self.get_md5(self.file)
+        stat = self.file.stat()
+        self.file.write_bytes(b"foobar")
+        # Keep the modification time so that only the size differs
+        os.utime(self.file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(
+            (hashlib.md5(b"foobar").hexdigest(), 1), self.get_md5(self.file))
+
+    def test_combined_checksum_follows_file_order(self):
+        other = Path(self.tmp_dir.name, "bar.txt")
+        other.write_bytes(b"bar")
+        self.assertEqual(
+            (hashlib.md5(b"foobar").hexdigest(), 1),
+            self.get_md5(self.file, other))
+        self.assertEqual(
+            (hashlib.md5(b"barfoo").hexdigest(), 1),
+            self.get_md5(other, self.file))
+
+
+class TestUpdateHasher(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.files = [
+            Path(self.tmp_dir.name, "foo.txt"),
+            Path(self.tmp_dir.name, "bar.txt"),
+        ]
+        self.files[0].write_bytes(b"foo" * 10)
+        self.files[1].write_bytes(b"bar" * 10)
+        self.expected = hashlib.md5(b"foo" * 10 + b"bar" * 10).hexdigest()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def update_hasher(self):
+        hasher = hashlib.md5()
+        for file_path in self.files:
+            with open(file_path, "rb", buffering=0) as file:
+                utils._update_hasher(hasher, file)
+        return hasher.hexdigest()
+
+    @patch.object(utils, "_MD5_BLOCK_SIZE", 7)
+    def test_readinto_is_used_without_file_digest(self):
+        # hashlib without file_digest, as in Python versions before 3.11
+        with patch.object(utils, "hashlib", spec=["md5"]):
+            self.assertEqual(self.expected, self.update_hasher())
+
+    @unittest.skipIf(not hasattr(hashlib, "file_digest"),
+                     "hashlib.file_digest requires Python 3.11")
+    def test_file_digest_updates_the_given_hasher(self):
+        with patch.object(hashlib, "file_digest",
+                          wraps=hashlib.file_digest) as file_digest:
+            self.assertEqual(self.expected, self.update_hasher())
+        self.assertEqual(len(self.files), file_digest.call_count)
+
+
+class TestVerifyFiles(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file = Path(self.tmp_dir.name, "foo.txt")
+        self.file.write_bytes(b"foo")
+        self.checksum = hashlib.md5(b"foo").hexdigest()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_files_are_verified_when_test_runs(self):
+        with patch.object(utils, "check_md5_for_files",
+                          wraps=utils.check_md5_for_files) as check:
+            @utils.verify_files([self.file], "wrong checksum", msg="foo")
+            def func():
+                return "bar"
+
+            self.assertEqual(0, check.call_count)
+            with self.assertRaises(unittest.SkipTest) as cm:
+                func()
+            self.assertEqual(1, check.call_count)
+        self.assertTrue(str(cm.exception).startswith("foo: "))
+
+    def test_verified_test_is_run(self):
+        @utils.verify_files([self.file], self.checksum)
+        def func():
+            return "bar"
+
+        self.assertEqual("bar", func())
+
+    def test_test_classes_are_skipped_when_decorated(self):
+        @utils.verify_files([self.file], "wrong checksum")
+        class Foo(unittest.TestCase):
+            pass
+
+        self.assertTrue(Foo.__unittest_skip__)
+
+        @utils.verify_files([self.file], self.checksum)
+        class Bar(unittest.TestCase):
+            pass
+
+        self.assertFalse(getattr(Bar, "__unittest_skip__", False))
+
+
+if __name__ == "__main__":
+    unittest.main()
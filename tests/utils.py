@@ -88,18 +88,66 @@ def change_wd_to_root(func):
     return wrapper
 
 
+_MD5_BLOCK_SIZE = 1 << 20
+
+# Checksums that have already been calculated during this test run. Keys
+# contain the resolved path, modification time and size of each file so that
+# modified files get hashed again.
+_MD5_CACHE = {}
+
+
 def get_md5_for_files(file_paths):
+    """Calculates MD5 hash for the combined content of all given files in
+    the given order. Files are read in fixed size blocks so that large files
+    do not have to be loaded into memory all at once.
+
+    Results are cached for as long as the files remain unchanged.
+    """
+    file_paths = list(file_paths)
+    key = []
+    for file_path in file_paths:
+        stat = os.stat(file_path)
+        key.append((Path(file_path).resolve(), stat.st_mtime_ns, stat.st_size))
+    key = tuple(key)
+    try:
+        return _MD5_CACHE[key]
+    except KeyError:
+        pass
+
+    checksum = _calculate_md5_for_files(file_paths)
+    _MD5_CACHE[key] = checksum
+    return checksum
+
+
+def _calculate_md5_for_files(file_paths):
     """Calculates MD5 hash for the combined content of all given
-    files."""
+    files without consulting the cache.
+    """
     hasher = hashlib.md5()
     for file_path in file_paths:
-        with open(file_path, "rb") as file:
-            buf = file.read()
-            hasher.update(buf)
+        with open(file_path, "rb", buffering=0) as file:
+            _update_hasher(hasher, file)
 
     return hasher.hexdigest()
 
 
+def _update_hasher(hasher, file):
+    """Feeds the contents of a binary file into the given hasher.
+    """
+    if hasattr(hashlib, "file_digest"):
+        # Uses hashlib.file_digest when it is available. The lambda makes
+        # file_digest update the shared hasher instead of a new one.
+        hashlib.file_digest(file, lambda: hasher)
+        return
+    buf = bytearray(_MD5_BLOCK_SIZE)
+    view = memoryview(buf)
+    while True:
+        n = file.readinto(buf)
+        if not n:
+            break
+        hasher.update(view[:n])
+
+
 def check_md5_for_files(file_paths, checksum):
     """Checks that the combined contents of all files match the
     given checksum.
@@ -127,13 +175,35 @@ def check_md5_for_files(file_paths, checksum):
 def verify_files(file_paths, checksum, msg=None):
     """Decorator function that can be used to verify files before
     running a test.
+
+    Files are verified when the decorated test is run, so tests that are not
+    selected do not have to hash any files. Test classes are verified when
+    they are decorated.
     """
-    b, reason = check_md5_for_files(file_paths, checksum)
-    if b:
-        return lambda func: func
-    if msg is not None:
-        return unittest.skip(f"{msg}: {reason}.")
-    return unittest.skip(reason)
+    def get_skip_reason():
+        b, reason = check_md5_for_files(file_paths, checksum)
+        if b:
+            return None
+        if msg is not None:
+            return f"{msg}: {reason}."
+        return reason
+
+    def decorator(func):
+        if isinstance(func, type):
+            reason = get_skip_reason()
+            if reason is None:
+                return func
+            return unittest.skip(reason)(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            reason = get_skip_reason()
+            if reason is not None:
+                raise unittest.SkipTest(reason)
+            return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
 
 
 WINDOWS = "Windows"
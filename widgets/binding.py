@@ -25,6 +25,7 @@ __author__ = "Juhani Sundell"
 __version__ = "2.0"
 
 import abc
+import functools
 import json
 import time
 
@@ -288,6 +289,22 @@ def _fset(instance: Any, qobj_name: str, value: Any):
 _DEBUB_MODE = False
 
 
+@functools.lru_cache(maxsize=None)
+def _get_property_names(cls: type, only_tracking_properties: bool) \
+        -> Tuple[str, ...]:
+    """Returns the names of the properties defined in the given class.
+
+    Properties are defined in the class body, so the names only have to be
+    looked up once per class instead of going through dir() of each widget
+    every time its properties are accessed.
+    """
+    prop_type = TrackingProperty if only_tracking_properties else property
+    return tuple(
+        d for d in dir(cls)
+        if isinstance(getattr(cls, d, None), prop_type)
+    )
+
+
 class PropertyBindingWidget(abc.ABC):
     """Base class for a widget that contains bindable properties.
     """
@@ -299,17 +316,8 @@ class PropertyBindingWidget(abc.ABC):
             only_tracking_properties: whether only TrackingProperties are
                 yielded.
         """
-        if only_tracking_properties:
-            def cond(prop):
-                return isinstance(getattr(type(self), prop), TrackingProperty)
-        else:
-            def cond(prop):
-                return isinstance(getattr(type(self), prop), property)
-        return (
-            d for d in dir(self)
-            if hasattr(type(self), d) and
-            cond(d)
-        )
+        return iter(_get_property_names(
+            type(self), only_tracking_properties))
 
     def set_properties(self, **kwargs):
         """Sets property values.
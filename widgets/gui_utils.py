@@ -27,6 +27,7 @@ __version__ = "2.0"
 import abc
 import platform
 import functools
+import importlib.util
 
 import modules.general_functions as gf
 
@@ -45,6 +46,7 @@ from modules.global_settings import GlobalSettings
 
 from PyQt5 import QtCore
 from PyQt5 import QtWidgets
+from PyQt5 import uic
 from PyQt5.QtCore import QSettings
 from PyQt5.QtGui import QWheelEvent
 
@@ -116,6 +118,52 @@ def get_ui_dir() -> Path:
     return gf.get_root_dir() / "ui_files"
 
 
+@functools.lru_cache(maxsize=None)
+def _get_ui_form_class(ui_file: Path) -> type:
+    """Returns the form class generated from the given .ui file. If the file
+    has been precompiled with dev/compile_ui_files.py and the compiled module
+    is up to date, the form class is imported from the module. Otherwise the
+    .ui file is parsed. Either way, this is only done on the first call.
+    """
+    compiled_file = ui_file.parent / "generated" / f"{ui_file.stem}.py"
+    try:
+        if compiled_file.stat().st_mtime >= ui_file.stat().st_mtime:
+            return _import_form_class(compiled_file)
+    except OSError:
+        pass
+    form_class, _ = uic.loadUiType(str(ui_file))
+    return form_class
+
+
+def _import_form_class(compiled_file: Path) -> type:
+    """Imports the form class from a module compiled from a .ui file.
+    """
+    spec = importlib.util.spec_from_file_location(
+        f"ui_files.generated.{compiled_file.stem}", compiled_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    form_class, = (
+        value for name, value in vars(module).items()
+        if name.startswith("Ui_") and isinstance(value, type))
+    return form_class
+
+
+def load_ui(ui_file: Path, qwidget: QtWidgets.QWidget):
+    """Sets up the given widget from a .ui file. Works like uic.loadUi but
+    the parsed form class is cached so the .ui file is not read every time
+    a widget is created.
+
+    Args:
+        ui_file: absolute path to a .ui file
+        qwidget: widget that is set up
+    """
+    form = _get_ui_form_class(Path(ui_file))()
+    form.setupUi(qwidget)
+    # Child widgets become attributes of the widget, just like with loadUi
+    for name, value in vars(form).items():
+        setattr(qwidget, name, value)
+
+
 def get_icon_dir() -> Path:
     """Returns absolute path to directory that contains Potku's icons.
     """
@@ -396,14 +444,28 @@ def fill_cuts_treewidget(measurement: Measurement,
     def text_func(fp: Path):
         return fp.name
 
-    fill_tree(root, cuts, text_func=text_func)
-
-    if use_elemloss:
-        elem_root = QtWidgets.QTreeWidgetItem(["Elemental Losses"])
-        fill_tree(elem_root, cuts_elemloss, text_func=text_func)
-        root.addChild(elem_root)
-
-    root.setExpanded(True)
+    # Layout, sorting and signals are suspended while the items are added
+    tree = root.treeWidget()
+    if tree is not None:
+        updates_enabled = tree.updatesEnabled()
+        sorting_enabled = tree.isSortingEnabled()
+        tree.setUpdatesEnabled(False)
+        tree.setSortingEnabled(False)
+        signals_blocked = tree.blockSignals(True)
+    try:
+        fill_tree(root, cuts, text_func=text_func)
+
+        if use_elemloss:
+            elem_root = QtWidgets.QTreeWidgetItem(["Elemental Losses"])
+            fill_tree(elem_root, cuts_elemloss, text_func=text_func)
+            root.addChild(elem_root)
+
+        root.setExpanded(True)
+    finally:
+        if tree is not None:
+            tree.blockSignals(signals_blocked)
+            tree.setSortingEnabled(sorting_enabled)
+            tree.setUpdatesEnabled(updates_enabled)
 
 
 def fill_tree(root: QtWidgets.QTreeWidgetItem, data: Iterable[Any],
@@ -420,11 +482,13 @@ def fill_tree(root: QtWidgets.QTreeWidgetItem, data: Iterable[Any],
             in the GUI.
         column: column number to use in the QTreeWidget.
     """
+    items = []
     for datapoint in data:
         item = QtWidgets.QTreeWidgetItem()
         item.setText(column, text_func(datapoint))
         item.setData(column, QtCore.Qt.UserRole, data_func(datapoint))
-        root.addChild(item)
+        items.append(item)
+    root.addChildren(items)
 
 
 def block_treewidget_signals(func: Callable):
@@ -474,7 +538,7 @@ def set_btn_group_data(button_group: QtWidgets.QButtonGroup, values:
     if len(btns) != len(values):
         raise ValueError(
             "Button group and data must have the same number of items")
-    for btn, value in zip(button_group.buttons(), values):
+    for btn, value in zip(btns, values):
         btn.setText(str(value))
         btn.data_item = value
 
@@ -39,6 +39,10 @@ from PyQt5 import QtWidgets
 from PyQt5 import QtGui
 from PyQt5 import QtCore
 
+# Characters that are removed from request names and from other names
+_INVALID_REQUEST_NAME_CHARS = re.compile("[^A-Za-z0-9_ÖöÄäÅå-]")
+_INVALID_NAME_CHARS = re.compile("[^A-Za-z0-9-ÖöÄäÅå]")
+
 
 class ScientificValidator(QtGui.QDoubleValidator):
     """Validator for scientific notation.
@@ -158,18 +162,12 @@ def validate_text_input(text, regex):
         text: Text to validate.
         regex: Regular expression to match.
     """
-    valid = re.match(regex + "$", text)
+    if re.match(regex + "$", text):
+        return text
 
     if "_" in regex:  # Request name
-        substitute_regex = "[^A-Za-z0-9_ÖöÄäÅå-]"
-    else:  # Other names
-        substitute_regex = "[^A-Za-z0-9-ÖöÄäÅå]"
-
-    if not valid:
-        valid_text = re.sub(substitute_regex, '', text)
-        return valid_text
-    else:
-        return text
+        return _INVALID_REQUEST_NAME_CHARS.sub("", text)
+    return _INVALID_NAME_CHARS.sub("", text)
 
 
 def sanitize_file_name(line_edit: QtWidgets.QLineEdit):
@@ -183,4 +181,7 @@ def sanitize_file_name(line_edit: QtWidgets.QLineEdit):
     regex = "^[A-Za-z0-9-ÖöÄäÅå]*"
     valid_text = validate_text_input(text, regex)
 
-    line_edit.setText(valid_text)
+    # Setting the text would move the cursor to the end, so it is only done
+    # if something was removed
+    if valid_text != text:
+        line_edit.setText(valid_text)
@@ -43,13 +43,18 @@ from typing import Callable
 from modules.base import Range
 from modules.base import StrTuple
 
+from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QToolButton
 from PyQt5.QtWidgets import QLabel
 
 
+@functools.lru_cache(maxsize=1)
 def format_coord(x: float, y: float) -> str:
     """Format mouse coordinates to string.
 
+    The latest result is cached as the same coordinates are often formatted
+    repeatedly while the mouse is not moving.
+
     Args:
         x: X coordinate.
         y: Y coordinate.
@@ -57,9 +62,7 @@ def format_coord(x: float, y: float) -> str:
     Return:
         Formatted text.
     """
-    x_part = f"\nx:{x:1.2f},"
-    y_part = f"\ny:{y:1.4f}"
-    return x_part + y_part
+    return f"\nx:{x:1.2f},\ny:{y:1.4f}"
 
 
 def format_x(x: float, _) -> str:
@@ -75,22 +78,29 @@ def format_x(x: float, _) -> str:
     return f"x:{x:1.4f}"
 
 
+def get_toolbar_button(toolbar, text: str) -> QToolButton:
+    """Returns the button of the NavigationToolBar action that has the given
+    text (for example "Home", "Pan" or "Zoom").
+
+    Raises ValueError if the toolbar has no such button.
+    """
+    for action in toolbar.actions():
+        if action.text() == text:
+            return toolbar.widgetForAction(action)
+    raise ValueError(f"Toolbar has no '{text}' button.")
+
+
 def get_toolbar_elements(toolbar, drag_callback=None, zoom_callback=None) -> \
         Tuple[Optional[QLabel], QToolButton, QToolButton]:
     """Returns tool label, drag button and zoom button from given
     NavigationToolBar.
     """
-    # Toolbar element indexes:
-    #   24  tool_label  (not always present)
-    #   12  drag button
-    #   14  zoom button
-    #   4   home    (not currently returned)
-    children = toolbar.children()
-    try:
-        tool_lbl = children[24]
-    except IndexError:
-        tool_lbl = None
-    drag_btn, zoom_btn = children[12], children[14]
+    # Elements are looked up by name instead of by their index among the
+    # toolbar's children, as the indexes depend on Matplotlib's version.
+    # Location label is only present if the toolbar shows coordinates.
+    tool_lbl = getattr(toolbar, "locLabel", None)
+    drag_btn = get_toolbar_button(toolbar, "Pan")
+    zoom_btn = get_toolbar_button(toolbar, "Zoom")
     if drag_callback is not None:
         drag_btn.clicked.connect(drag_callback)
     if zoom_callback is not None:
@@ -98,6 +108,16 @@ def get_toolbar_elements(toolbar, drag_callback=None, zoom_callback=None) -> \
     return tool_lbl, drag_btn, zoom_btn
 
 
+def draw_idle_when_shown(canvas):
+    """Requests a redraw of the given canvas unless the canvas has not been
+    shown yet. Showing the canvas sends it a resize event that redraws it at
+    its actual size, so drawing a canvas that has never been shown is wasted
+    work.
+    """
+    if not canvas.testAttribute(Qt.WA_PendingResizeEvent):
+        canvas.draw_idle()
+
+
 def draw_and_flush(func):
     """Decorator function that draws and flushes the canvas object of the
     caller.
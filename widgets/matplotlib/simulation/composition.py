@@ -265,7 +265,10 @@ class _CompositionWidget(MatplotlibWidget):
             self.mpl_toolbar.mode_tool = 1
         else:
             self.mpl_toolbar.mode_tool = 0
-        self.canvas.draw_idle()
+        # Changing the tool does not change the plot, so only redraw if
+        # something else is pending
+        if self.fig.stale:
+            self.canvas.draw_idle()
 
     def __toggle_tool_zoom(self):
         """Toggles the zoom tool."""
@@ -273,7 +276,10 @@ class _CompositionWidget(MatplotlibWidget):
             self.mpl_toolbar.mode_tool = 2
         else:
             self.mpl_toolbar.mode_tool = 0
-        self.canvas.draw_idle()
+        # Changing the tool does not change the plot, so only redraw if
+        # something else is pending
+        if self.fig.stale:
+            self.canvas.draw_idle()
 
     def __fork_toolbar_buttons(self):
         """
@@ -28,24 +28,25 @@ __author__ = "Severi Jääskeläinen \n Samuel Kaiponen \n Heta Rekilä \n " \
              "Sinikka Siironen \n Juhani Sundell"
 __version__ = "2.0"
 
+import re
+
 import matplotlib
+import numpy as np
 
 import modules.general_functions as gf
 import dialogs.dialog_functions as df
 
 from widgets.matplotlib import mpl_utils
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 from typing import Tuple
 from typing import Dict
 from typing import List
 
-from dialogs.simulation.multiply_area import MultiplyAreaDialog
-from dialogs.simulation.recoil_element_selection import \
-    RecoilElementSelectionDialog
-from dialogs.simulation.recoil_info_dialog import RecoilInfoDialog
-
 from matplotlib import offsetbox
+from matplotlib.collections import LineCollection
+from matplotlib.collections import PolyCollection
 from matplotlib.widgets import RectangleSelector
 from matplotlib.widgets import SpanSelector
 
@@ -68,7 +69,7 @@ from widgets.matplotlib.mpl_utils import VerticalLimits
 from widgets.matplotlib.mpl_utils import AlternatingLimits
 from widgets.matplotlib.base import MatplotlibWidget
 from widgets.matplotlib.simulation.element import ElementWidget
-from widgets.simulation.controls import SimulationControlsWidget
+from widgets.simulation.controls import LazySimulationControlsWidget
 from widgets.simulation.percentage_widget import PercentageWidget
 from widgets.simulation.point_coordinates import PointCoordinatesWidget
 from widgets.simulation.recoil_element import RecoilElementWidget
@@ -77,6 +78,10 @@ from widgets.icon_manager import IconManager
 from modules.enums import SimulationType
 from modules.config_manager import ConfigManager
 
+# Names that are given to new recoil elements by ElementWidget
+_DEFAULT_RECOIL_NAME = re.compile(r"^Default-(\d+)$")
+
+
 class ElementManager:
     """A class that manipulates the elements of the simulation.
 
@@ -102,6 +107,44 @@ class ElementManager:
         self.simulation = simulation
         self.statusbar = statusbar
         self.element_simulations = self.simulation.element_simulations
+        # Maps radio buttons to their ElementSimulations and RecoilElements
+        self._radio_buttons: Dict[
+            QtWidgets.QAbstractButton,
+            Tuple[ElementSimulation, RecoilElement]] = {}
+
+    def _index_recoil_element(self, recoil_element: RecoilElement,
+                              element_simulation: ElementSimulation):
+        """Adds the radio button of the recoil element's widget to the radio
+        button index.
+        """
+        self._radio_buttons[recoil_element.widgets[0].radio_button] = \
+            element_simulation, recoil_element
+
+    def forget_recoil_element(self, recoil_element: RecoilElement):
+        """Removes the radio button of the recoil element's widget from the
+        radio button index.
+        """
+        if recoil_element.widgets:
+            self._radio_buttons.pop(
+                recoil_element.widgets[0].radio_button, None)
+
+    def _find_with_radio_button(self, radio_button) \
+            -> Tuple[Optional[ElementSimulation], Optional[RecoilElement]]:
+        """Returns the ElementSimulation and RecoilElement that the radio
+        button belongs to. Recoils that were added to an ElementSimulation
+        outside of ElementManager are searched for and indexed on first use.
+        """
+        try:
+            return self._radio_buttons[radio_button]
+        except KeyError:
+            pass
+        for element_simulation in self.element_simulations:
+            for recoil_element in element_simulation.recoil_elements:
+                if recoil_element.widgets[0].radio_button == radio_button:
+                    self._index_recoil_element(
+                        recoil_element, element_simulation)
+                    return element_simulation, recoil_element
+        return None, None
 
     def get_element_simulation_with_recoil_element(
             self, recoil_element: RecoilElement) -> ElementSimulation:
@@ -129,14 +172,11 @@ class ElementManager:
         Return:
             ElementSimulation.
         """
-        for element_simulation in self.element_simulations:
-            for button in self.get_radio_buttons(element_simulation):
-                if button == radio_button:
-                    return element_simulation
+        element_simulation, _ = self._find_with_radio_button(radio_button)
+        return element_simulation
 
-    @staticmethod
     def get_recoil_element_with_radio_button(
-            radio_button,
+            self, radio_button,
             element_simulation: ElementSimulation) -> RecoilElement:
         """
         Get recoil element with radio button from given element simulation.
@@ -148,6 +188,9 @@ class ElementManager:
         Return:
             RecoilElement.
         """
+        elem_sim, recoil_element = self._find_with_radio_button(radio_button)
+        if elem_sim is element_simulation:
+            return recoil_element
         for recoil_element in element_simulation.recoil_elements:
             if recoil_element.widgets[0].radio_button == radio_button:
                 return recoil_element
@@ -229,10 +272,7 @@ class ElementManager:
             ys.pop()
         xs.pop()
 
-        xys = list(zip(xs, ys))
-        points = []
-        for xy in xys:
-            points.append(Point(xy))
+        points = [Point(xy) for xy in zip(xs, ys)]
 
         rec_type = self.simulation.request.default_element_simulation\
             .simulation_type.get_recoil_type()
@@ -248,9 +288,10 @@ class ElementManager:
             recoil_name_changed=recoil_name_changed,
             settings_updated=settings_updated)
         recoil_element.widgets.append(element_widget)
+        self._index_recoil_element(recoil_element, element_simulation)
 
         # Add simulation controls widget
-        simulation_controls_widget = SimulationControlsWidget(
+        simulation_controls_widget = LazySimulationControlsWidget(
             element_simulation, self.parent,
             recoil_name_changed=recoil_name_changed,
             settings_updated=settings_updated, **kwargs)
@@ -285,9 +326,11 @@ class ElementManager:
             settings_updated=settings_updated)
         element_simulation.get_main_recoil().widgets.append(
             main_element_widget)
+        self._index_recoil_element(
+            element_simulation.get_main_recoil(), element_simulation)
 
         # Add simulation controls widget
-        simulation_controls_widget = SimulationControlsWidget(
+        simulation_controls_widget = LazySimulationControlsWidget(
             element_simulation, self.parent,
             recoil_name_changed=recoil_name_changed,
             settings_updated=settings_updated, **kwargs)
@@ -316,17 +359,15 @@ class ElementManager:
             recoil_name_changed=recoil_name_changed
         )
         recoil_element.widgets.append(recoil_element_widget)
+        self._index_recoil_element(recoil_element, element_simulation)
 
         # Check if there are e.g. Default-1 named recoil elements. If so,
         # increase element.running_int_recoil
-        recoil_name = recoil_element.name
-        if recoil_name.startswith("Default-"):
-            possible_int = recoil_name.split('-')[1]
-            try:
-                integer = int(possible_int)
-                main_element_widget.running_int_recoil = integer + 1
-            except ValueError:
-                pass
+        match = _DEFAULT_RECOIL_NAME.match(recoil_element.name)
+        if match is not None:
+            main_element_widget.running_int_recoil = max(
+                main_element_widget.running_int_recoil,
+                int(match.group(1)) + 1)
         return recoil_element_widget
 
     def update_element_simulation(self, element_simulation: ElementSimulation,
@@ -367,6 +408,8 @@ class ElementManager:
         Args:
             element_simulation: An ElementSimulation object to be removed.
         """
+        for recoil_element in element_simulation.recoil_elements:
+            self.forget_recoil_element(recoil_element)
         element_simulation.get_main_recoil().delete_widgets()
         self.element_simulations.remove(element_simulation)
 
@@ -384,10 +427,10 @@ class ElementManager:
         Return:
             List of buttons that have the same ElementSimulation reference.
         """
-        radio_buttons = []
-        for recoil_element in element_simulation.recoil_elements:
-            radio_buttons.append(recoil_element.widgets[0].radio_button)
-        return radio_buttons
+        return [
+            recoil_element.widgets[0].radio_button
+            for recoil_element in element_simulation.recoil_elements
+        ]
 
     def has_element(self, element: Element) -> bool:
         """Checks whether any ElementSimulation has an element that matches
@@ -411,6 +454,43 @@ def _full_edit_from_btn(instance, attr):
     return btn.text() == "Full edit unlocked"
 
 
+def _get_coordinate_array(points: List[Point]) -> np.ndarray:
+    """Returns the coordinates of the given points as an array of shape
+    (n, 2). The array is filled directly without building intermediate
+    lists.
+    """
+    return np.fromiter(
+        (c for point in points for c in point.get_coordinates()),
+        dtype=np.float64, count=2 * len(points)
+    ).reshape(-1, 2)
+
+
+def _set_line_data(line: matplotlib.lines.Line2D, xs: np.ndarray,
+                   ys: np.ndarray):
+    """Sets the data of the line unless it already has the same data, so
+    that the line's path does not have to be recalculated needlessly.
+    """
+    old_xs, old_ys = line.get_data()
+    if np.array_equal(old_xs, xs) and np.array_equal(old_ys, ys):
+        return
+    line.set_data(xs, ys)
+
+
+def _set_line_color(line: matplotlib.lines.Line2D, color):
+    """Sets the color of the line if it has changed.
+    """
+    if line.get_color() != color:
+        line.set_color(color)
+
+
+def _set_artist_visible(artist: matplotlib.artist.Artist, b: bool):
+    """Sets the visibility of the artist if it has changed. Older Matplotlib
+    versions mark the artist stale on every set_visible call.
+    """
+    if artist.get_visible() != b:
+        artist.set_visible(b)
+
+
 class RecoilAtomDistributionWidget(MatplotlibWidget):
     """Matplotlib simulation recoil atom distribution widget.
     Using this widget, the user can edit the recoil atom distribution
@@ -427,6 +507,8 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
         1: "pan/zoom",  # Matplotlib's drag
         2: "zoom rect"  # Matplotlib's zoom
     }
+    # Default maximum number of redraws per second while dragging points
+    DEFAULT_MAX_REDRAW_RATE = 30
     # Signal that is emitted when recoil distribution changes
     recoil_dist_changed = pyqtSignal(RecoilElement, ElementSimulation)
     # Signal that is emitted when limit values are changed
@@ -447,6 +529,13 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
         _full_edit_to_btn(self, "edit_lock_push_button", value)
         self.full_edit_changed.emit()
 
+    @property
+    def ratio_str(self) -> str:
+        """Clipboard text that is offered as the ratio when point coordinates
+        are multiplied.
+        """
+        return self.clipboard.text()
+
     def __init__(self, parent: "TargetWidget", simulation: Simulation,
                  target: Target, tab: BaseTab, icon_manager: IconManager,
                  settings: GlobalSettings,
@@ -509,14 +598,28 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
         self.edit_lock_push_button.clicked.connect(self.unlock_or_lock_edit)
         self.full_edit_on = True
 
-        # Locations of points about to be dragged at the time of click
-        self.click_locations = []
+        # Last values set to widgets that are only modified by this widget
+        self._main_recoil_buttons_enabled: Optional[bool] = None
+        self._name_label_text: Optional[str] = None
+
+        # Locations of points about to be dragged at the time of click as an
+        # array of shape (n, 2)
+        self.click_locations = np.empty((0, 2))
+        # Location of the click that started the dragging
+        self.click_xy = (0.0, 0.0)
         # Distances between points about to be dragged
-        self.x_dist_left = []  # x dist to leftmost point
-        self.x_dist_right = []  # x dist to rightmost point
-        self.y_dist_lowest = []  # y dist to lowest point
+        self.x_dist_left = np.empty(0)  # x dist to leftmost point
+        self.x_dist_right = np.empty(0)  # x dist to rightmost point
+        self.y_dist_lowest = np.empty(0)  # y dist to lowest point
         # Index of lowest point about to be dragged
         self.lowest_dr_p_i = 0
+        # Limits set by the neighbors of the dragged points for the x
+        # coordinates of the leftmost and rightmost dragged points. None if
+        # there is no neighbor.
+        self.drag_x_limits: Tuple[Optional[float], Optional[float]] = \
+            (None, None)
+        # Minimum y coordinate for the dragged points
+        self.drag_y_min = 0.0001
         # Minimum x distance between points
         self.x_res = 0.01
         # Minimum y coordinate for points
@@ -556,9 +659,41 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
         self.__x_end = None
 
         self.annotations = []
+        # Background spans of all layers drawn as a single artist
+        self._layer_spans: Optional[PolyCollection] = None
         self.trans = matplotlib.transforms.blended_transform_factory(
             self.axes.transData, self.axes.transAxes)
 
+        # Nesting depth of batched updates and whether update_plot was called
+        # during them
+        self._batch_depth = 0
+        self._redraw_pending = False
+
+        # Coalesces plot updates that are requested during the same event
+        # loop iteration
+        self._plot_update_timer = QtCore.QTimer(self)
+        self._plot_update_timer.setSingleShot(True)
+        self._plot_update_timer.setInterval(0)
+        self._plot_update_timer.timeout.connect(self.update_plot)
+
+        # Limits the rate at which the plot is redrawn while points are
+        # dragged. Points are still moved on every motion event.
+        self._drag_redraw_timer = QtCore.QTimer(self)
+        self._drag_redraw_timer.setSingleShot(True)
+        self._drag_redraw_timer.timeout.connect(self.update_plot)
+        self.max_redraw_rate = self.DEFAULT_MAX_REDRAW_RATE
+
+        # Background of the canvas without the distribution artists. Used for
+        # blitting while points are being dragged. The bounds of the axes
+        # are stored with it so that a stale background is never restored.
+        self._background = None
+        self._background_bounds = None
+        # The background has to be cached before the selectors cache their
+        # own backgrounds, so this must be connected before the selectors
+        # are created.
+        self.canvas.mpl_connect("draw_event", self._on_canvas_draw)
+        self.canvas.mpl_connect("resize_event", self._invalidate_background)
+
         # Span selection tool (used to select all points within a range
         # on the x axis)
         self.span_selector = SpanSelector(
@@ -578,8 +713,6 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
 
         self.locale = QLocale.c()
         self.clipboard = QGuiApplication.clipboard()
-        self.ratio_str = self.clipboard.text()
-        self.clipboard.changed.connect(self.__update_multiply_action)
 
         self.__button_individual_limits = None
         self.coordinates_widget: Optional[PointCoordinatesWidget] = None
@@ -600,7 +733,8 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
 
         # This holds all the recoils that aren't current ly selected
         self.other_recoils = []
-        self.other_recoils_lines = []
+        # All other recoils are drawn by a single LineCollection
+        self.other_recoils_lines: Optional[LineCollection] = None
 
         self.target_thickness = 0
 
@@ -617,6 +751,11 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
         for button in self.radios.buttons():
             button.setChecked(True)
             break
+        # Update the plot right away while the parent widget is still being
+        # initialized, as a scheduled update would also save the target.
+        if self._plot_update_timer.isActive():
+            self._plot_update_timer.stop()
+            self.update_plot()
 
         self.update_element_simulation.connect(
             lambda elem_sim: self.element_manager.update_element_simulation(
@@ -771,17 +910,36 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
             **self.get_individual_limits()
         }
 
+    @contextmanager
+    def _batched_updates(self):
+        """Context manager that defers plot updates and repainting of the
+        recoil element widgets until the outermost batch has finished.
+        """
+        container = self.recoil_vertical_layout.parentWidget()
+        updates_enabled = container.updatesEnabled()
+        container.setUpdatesEnabled(False)
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            container.setUpdatesEnabled(updates_enabled)
+            if not self._batch_depth and self._redraw_pending:
+                self._redraw_pending = False
+                self.update_plot()
+
     def __update_figure(self, **kwargs):
         """Update figure.
         """
-        for element_simulation in self.simulation.element_simulations:
-            self.add_element(
-                element_simulation.get_main_recoil().element,
-                element_simulation=element_simulation, **kwargs)
+        with self._batched_updates():
+            for element_simulation in self.simulation.element_simulations:
+                self.add_element(
+                    element_simulation.get_main_recoil().element,
+                    element_simulation=element_simulation, **kwargs)
 
-        self.simulation.element_simulations[0].get_main_recoil(). \
-            widgets[0].radio_button.setChecked(True)
-        self.show_other_recoils()
+            self.simulation.element_simulations[0].get_main_recoil(). \
+                widgets[0].radio_button.setChecked(True)
+            self.show_other_recoils()
 
     def __create_percent_widget(self):
         """Create a widget that calculates and shows the percentages of recoils
@@ -800,6 +958,10 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
     def open_recoil_element_info(self):
         """Open recoil element info.
         """
+        # Dialogs are imported only when they are first opened so that they
+        # do not slow down the construction of the widget.
+        from dialogs.simulation.recoil_info_dialog import RecoilInfoDialog
+
         dialog = RecoilInfoDialog(
             self.current_recoil_element, self.colormap,
             self.current_element_simulation)
@@ -900,7 +1062,7 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
         else:
             self.current_element_simulation.lock_edit()
             self.full_edit_on = False
-        self.update_plot()
+        self.schedule_plot_update()
 
     def update_colors(self):
         """Update the view with current recoil element's color.
@@ -940,8 +1102,7 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
         # Disable element simulation deletion button and full edit for
         # other than main recoil element
         if not self.main_recoil_selected():
-            self.parent.removePushButton.setEnabled(False)
-            self.edit_lock_push_button.setEnabled(False)
+            self._set_main_recoil_buttons_enabled(False)
             # Update zero values and intervals for main recoil element
             self.get_current_main_recoil().update_zero_values()
             # If zero values changed, update them to current recoil element
@@ -954,8 +1115,7 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
                 self.update_current_recoils_zeros()
                 self.delete_and_add_possible_extra_points()
         else:
-            self.parent.removePushButton.setEnabled(True)
-            self.edit_lock_push_button.setEnabled(True)
+            self._set_main_recoil_buttons_enabled(True)
         self.parent.elementInfoWidget.show()
         # Put full edit on if element simulation allows it
         self.full_edit_on = \
@@ -976,25 +1136,39 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
         # Make all other recoils grey
         self.show_other_recoils()
 
-        self.update_plot()
+        self.schedule_plot_update()
+
+    def _set_main_recoil_buttons_enabled(self, b: bool):
+        """Enables or disables the buttons that only apply to main recoils.
+        Buttons are not touched if their state has not changed.
+        """
+        if self._main_recoil_buttons_enabled is b:
+            return
+        self._main_recoil_buttons_enabled = b
+        self.parent.removePushButton.setEnabled(b)
+        self.edit_lock_push_button.setEnabled(b)
 
     def show_other_recoils(self):
         """Show other recoils than current recoil in grey.
         """
-        for line in self.other_recoils_lines:
-            line.set_visible(False)
-        # TODO it would be better to update the old lines rather than keep
-        #   adding new lines
-        self.other_recoils_lines = []
-        for element_simulation in self.simulation.element_simulations:
-            for recoil in element_simulation.recoil_elements:
-                if recoil in self.other_recoils:
-                    xs = recoil.get_xs()
-                    ys = recoil.get_ys()
-                    rec_line = self.axes.plot(
-                        xs, ys, color=recoil.color, alpha=0.3, visible=True,
-                        zorder=1)
-                    self.other_recoils_lines.append(rec_line[0])
+        recoils = [
+            recoil
+            for element_simulation in self.simulation.element_simulations
+            for recoil in element_simulation.recoil_elements
+            if recoil in self.other_recoils
+        ]
+        if self.other_recoils_lines is None:
+            # Cap and join styles match the ones used by Line2D
+            self.other_recoils_lines = LineCollection(
+                [], alpha=0.3, zorder=1, capstyle="projecting",
+                joinstyle="round")
+            self.axes.add_collection(self.other_recoils_lines)
+        self.other_recoils_lines.set_segments([
+            _get_coordinate_array(recoil.get_points()) for recoil in recoils
+        ])
+        self.other_recoils_lines.set_color([
+            recoil.color for recoil in recoils
+        ])
         self.fig.canvas.draw_idle()
 
     def delete_and_add_possible_extra_points(self):
@@ -1177,8 +1351,10 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
     def update_recoil_element_info_labels(self):
         """Update recoil element info labels.
         """
-        self.parent.nameLabel.setText(
-            f"Element: {self.current_recoil_element.get_full_name()}")
+        text = f"Element: {self.current_recoil_element.get_full_name()}"
+        if text != self._name_label_text:
+            self._name_label_text = text
+            self.parent.nameLabel.setText(text)
 
     def recoil_element_info_on_switch(self):
         """Show recoil element info on switch.
@@ -1191,6 +1367,9 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
     def add_element_with_dialog(self, **kwargs):
         """Add new element simulation with dialog.
         """
+        from dialogs.simulation.recoil_element_selection import \
+            RecoilElementSelectionDialog
+
         dialog = RecoilElementSelectionDialog(self)
         if not dialog.isOk:
             return
@@ -1283,6 +1462,7 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
                 widgets[0].radio_button.setChecked(True)
         # Remove radio button from list
         self.radios.removeButton(recoil_widget.radio_button)
+        self.element_manager.forget_recoil_element(recoil_to_delete)
         # Remove recoil widget from view
         recoil_widget.deleteLater()
         # Remove recoil element from element simulation
@@ -1390,7 +1570,7 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
         self.remove_element(element_simulation)
         self.show_other_recoils()
         self.parent.elementInfoWidget.hide()
-        self.update_plot()
+        self.schedule_plot_update()
 
     def remove_all_elements(self, export_dialog=False):
         """Removes all element simulations
@@ -1432,13 +1612,24 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
         """Export elements from target layers into element simulations if they
         do not already exist.
         """
-        if len(self.element_manager.element_simulations) >= 1:
-            self.remove_all_elements(export_dialog=True)
-        for layer in self.target.layers:
-            for element in layer.elements:
-                if not self.element_manager.has_element(element):
+        with self._batched_updates():
+            if len(self.element_manager.element_simulations) >= 1:
+                self.remove_all_elements(export_dialog=True)
+            existing = {
+                (recoil.element.symbol, recoil.element.isotope,
+                 recoil.element.RRectype)
+                for elem_sim in self.element_manager.element_simulations
+                for recoil in elem_sim.recoil_elements
+            }
+            for layer in self.target.layers:
+                for element in layer.elements:
+                    key = element.symbol, element.isotope, element.RRectype
+                    if key in existing:
+                        continue
                     color = self.colormap[element.symbol]
-                    self.add_element(element, color=color, **kwargs)
+                    if self.add_element(
+                            element, color=color, **kwargs) is not None:
+                        existing.add(key)
         # Saving here prevents issues with mismatching data files
         self.parent._save_target_and_recoils(True)
 
@@ -1446,19 +1637,21 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
         """Draw method for matplotlib.
         """
         self.axes.clear()  # Clear old stuff
+        self.annotations = []
+        self._layer_spans = None
+        self.anchored_box = None
+        self.other_recoils_lines = None
 
         self.axes.set_ylabel(self.name_y_axis)
         self.axes.set_xlabel(self.name_x_axis)
 
         if self.current_element_simulation:
+            xs, ys = np.array(self.current_recoil_element.get_xs_and_ys())
             self.lines, = self.axes.plot(
-                self.current_recoil_element.get_xs(),
-                self.current_recoil_element.get_ys(),
-                color=self.current_recoil_element.color)
+                xs, ys, color=self.current_recoil_element.color)
 
             self.markers, = self.axes.plot(
-                self.current_recoil_element.get_xs(),
-                self.current_recoil_element.get_ys(),
+                xs, ys,
                 color=self.current_recoil_element.color, marker="o",
                 markersize=10, linestyle="None")
 
@@ -1477,9 +1670,91 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
         self.axes.set_xlim(-1, 40)
         self.axes.set_ylim(-0.1, 2)
 
+        # Clearing the axes also removed the previous limit callbacks
+        self._invalidate_background()
+        self.axes.callbacks.connect(
+            "xlim_changed", self._invalidate_background)
+        self.axes.callbacks.connect(
+            "ylim_changed", self._invalidate_background)
+
         # Remove axis ticks and draw
         self.remove_axes_ticks()
-        self.canvas.draw()
+        self.canvas.draw_idle()
+
+    def _get_blit_artists(self) -> List[matplotlib.artist.Artist]:
+        """Returns the artists that are redrawn when blitting.
+        """
+        artists = [self.lines, self.markers, self.markers_selected]
+        if self.anchored_box is not None:
+            artists.append(self.anchored_box)
+        return artists
+
+    def _start_blitting(self):
+        """Animates the distribution artists and requests a redraw of the
+        canvas so that the background can be cached for blitting while points
+        are dragged. Until the redraw has happened, updates fall back to
+        requesting redraws.
+        """
+        for artist in self._get_blit_artists():
+            artist.set_animated(True)
+        self._invalidate_background()
+        self.canvas.draw_idle()
+
+    def _stop_blitting(self):
+        """Stops animating the distribution artists. The canvas needs to be
+        redrawn afterwards.
+        """
+        for artist in self._get_blit_artists():
+            artist.set_animated(False)
+            # Changes made while animated were not propagated to the figure
+            artist.stale = True
+        self._invalidate_background()
+
+    def _on_canvas_draw(self, event):
+        """Caches the background after the canvas has been drawn if the
+        distribution artists are animated.
+
+        Args:
+            event: a MPL DrawEvent
+        """
+        if event.canvas is not self.canvas:
+            return  # Figure is being saved
+        if self.lines is None or not self.lines.get_animated():
+            return
+        if not self.markers.get_visible():
+            # Selectors hide the animated artists and redraw the canvas
+            # when they cache their own backgrounds. The background cached
+            # by the outer draw is the same, so there is nothing to do.
+            return
+        self._background = self.canvas.copy_from_bbox(self.axes.bbox)
+        self._background_bounds = self.axes.bbox.bounds
+        for artist in self._get_blit_artists():
+            self.axes.draw_artist(artist)
+
+    def _invalidate_background(self, *_):
+        """Discards the cached background when the canvas is resized or the
+        axis limits change, as it no longer matches what would be drawn. A
+        new one is cached when the canvas is redrawn.
+
+        Args:
+            *_: unused MPL event or axes
+        """
+        self._background = None
+        self._background_bounds = None
+
+    def _blit_draw(self):
+        """Redraws only the distribution artists on top of the cached
+        background. Falls back to a full redraw if there is no background or
+        the size of the axes has changed since it was cached.
+        """
+        if self._background is None or \
+                self._background_bounds != self.axes.bbox.bounds:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        for artist in self._get_blit_artists():
+            self.axes.draw_artist(artist)
+        self.canvas.blit(self.axes.bbox)
 
     def __toggle_tool_drag(self):
         """Toggle drag tool.
@@ -1490,7 +1765,10 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
         else:
             self.mpl_toolbar.mode_tool = 0
             self.__show_all_recoil = True
-        self.canvas.draw_idle()
+        # Changing the tool does not change the plot, so only redraw if
+        # something else is pending
+        if self.fig.stale:
+            self.canvas.draw_idle()
 
     def __toggle_tool_zoom(self):
         """
@@ -1502,7 +1780,10 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
         else:
             self.mpl_toolbar.mode_tool = 0
             self.__show_all_recoil = True
-        self.canvas.draw_idle()
+        # Changing the tool does not change the plot, so only redraw if
+        # something else is pending
+        if self.fig.stale:
+            self.canvas.draw_idle()
 
     def __fork_toolbar_buttons(self):
         """Fork navigation tool bar button into custom ones.
@@ -1597,11 +1878,6 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
         self.__button_span_limits.setChecked(self.area_limits_for_all_on)
         self.canvas.draw_idle()
 
-    def __update_multiply_action(self):
-        """Update the correct value to show from clipboard.
-        """
-        self.ratio_str = self.clipboard.text()
-
     def set_selected_point_x(self, x=None, clicked=None):
         """Sets the selected point's x coordinate
         to the value of the x spinbox.
@@ -1643,7 +1919,7 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
         elif right_neighbor.get_x() <= x:
             clicked.set_x(right_neighbor.get_x() - self.x_res)
 
-        self.update_plot()
+        self.schedule_plot_update()
 
     def set_selected_point_y(self, y=None, clicked=None):
         """Sets the selected point's y coordinate to the value of the y spinbox.
@@ -1661,7 +1937,7 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
             clicked.set_y(y)
         elif self.clicked_point is not None:
             self.clicked_point.set_y(y)
-        self.update_plot()
+        self.schedule_plot_update()
 
     def on_click(self, event):
         """ On click event above graph.
@@ -1671,12 +1947,12 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
         """
         if self.current_element_simulation is None:
             return
+        # Only inside the actual graph axes, else do nothing.
+        if event.inaxes is not self.axes:
+            return
         # Don't do anything if drag tool or zoom tool is active.
         if self.__button_drag.isChecked() or self.__button_zoom.isChecked():
             return
-        # Only inside the actual graph axes, else do nothing.
-        if event.inaxes != self.axes:
-            return
         if event.button == 1:  # Left click
             marker_contains, marker_info = self.markers.contains(event)
             if marker_contains:  # If clicked a point
@@ -1690,6 +1966,7 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
                     self.selected_points = [clicked_point]
                 self.dragged_points.extend(self.selected_points)
                 self.clicked_point = clicked_point
+                self._start_blitting()
                 # If clicked point is first
                 if self.first_point_selected():
                     self.point_remove_action.setEnabled(False)
@@ -1735,6 +2012,7 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
                             self.selected_points = [new_point]
                             self.dragged_points = [new_point]
                             self.clicked_point = new_point
+                            self._start_blitting()
 
                             self.coordinates_widget.setVisible(True)
 
@@ -1753,26 +2031,35 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
 
     def set_on_click_attributes(self, event):
         """Sets the attributes needed for dragging points."""
-        locations = []
-        for point in self.dragged_points:
-            x0, y0 = point.get_coordinates()
-            locations.append((x0, y0, event.xdata, event.ydata))
-        self.click_locations = locations
-
-        self.x_dist_left = [self.dragged_points[i].get_x()
-                            - self.dragged_points[0].get_x()
-                            for i in range(1, len(self.dragged_points))]
-        self.x_dist_right = [self.dragged_points[-1].get_x()
-                             - self.dragged_points[i].get_x()
-                             for i in range(0, len(self.dragged_points) - 1)]
-        self.lowest_dr_p_i = 0
-        for i in range(1, len(self.dragged_points)):
-            if self.dragged_points[i].get_y() \
-                    < self.dragged_points[self.lowest_dr_p_i].get_y():
-                self.lowest_dr_p_i = i
-        self.y_dist_lowest = [self.dragged_points[i].get_y()
-                              - self.dragged_points[self.lowest_dr_p_i].get_y()
-                              for i in range(len(self.dragged_points))]
+        self.click_locations = _get_coordinate_array(self.dragged_points)
+        self.click_xy = event.xdata, event.ydata
+        if not len(self.click_locations):
+            return
+
+        xs = self.click_locations[:, 0]
+        ys = self.click_locations[:, 1]
+        self.x_dist_left = xs[1:] - xs[0]
+        self.x_dist_right = xs[-1] - xs[:-1]
+        self.lowest_dr_p_i = int(np.argmin(ys))
+        self.y_dist_lowest = ys - ys[self.lowest_dr_p_i]
+
+        # Neighbors are not dragged, so the limits they set stay the same
+        # for the whole drag
+        left_neighbor = self.current_recoil_element.get_left_neighbor(
+            self.dragged_points[0])
+        right_neighbor = self.current_recoil_element.get_right_neighbor(
+            self.dragged_points[-1])
+        self.drag_x_limits = (
+            left_neighbor.get_x() + self.x_res
+            if left_neighbor is not None else None,
+            right_neighbor.get_x() - self.x_res
+            if right_neighbor is not None else None
+        )
+        if self.main_recoil_selected() and \
+                self.current_element_simulation.get_full_edit_on():
+            self.drag_y_min = 0.0
+        else:
+            self.drag_y_min = 0.0001
 
     def add_point(self, new_point, special=False, recoil=None, multiply=False):
         """Adds a point if there is space for it.
@@ -1848,47 +2135,61 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
                 new_point.set_x(left_neighbor_x + self.x_res)
             return new_point
 
+    @property
+    def max_redraw_rate(self) -> float:
+        """Maximum number of times per second the plot is redrawn while
+        points are being dragged.
+        """
+        return 1000 / max(1, self._drag_redraw_timer.interval())
+
+    @max_redraw_rate.setter
+    def max_redraw_rate(self, value: float):
+        if value <= 0:
+            raise ValueError("Redraw rate must be positive.")
+        self._drag_redraw_timer.setInterval(round(1000 / value))
+
+    def schedule_plot_update(self):
+        """Updates the plot when control returns to the event loop. Multiple
+        calls before that result in a single update.
+        """
+        self._plot_update_timer.start()
+
     def update_plot(self):
         """Updates marker and line data and redraws the plot.
         """
+        if self._batch_depth:
+            self._redraw_pending = True
+            return
         if hasattr(self.parent, 'recoil_distribution_widget'):
             self.parent._save_target_and_recoils(True)
         if self.current_element_simulation is None:
-            self.markers.set_visible(False)
-            self.lines.set_visible(False)
-            self.markers_selected.set_visible(False)
-            self.fig.canvas.draw_idle()
+            _set_artist_visible(self.markers, False)
+            _set_artist_visible(self.lines, False)
+            _set_artist_visible(self.markers_selected, False)
+            if self.fig.stale:
+                self.fig.canvas.draw_idle()
             return
 
-        self.markers.set_data(
-            self.current_recoil_element.get_xs(),
-            self.current_recoil_element.get_ys()
-        )
-        self.lines.set_data(
-            self.current_recoil_element.get_xs(),
-            self.current_recoil_element.get_ys()
-        )
+        # Coordinates are collected once and shared by all artists
+        xs, ys = np.array(self.current_recoil_element.get_xs_and_ys())
+        _set_line_data(self.markers, xs, ys)
+        _set_line_data(self.lines, xs, ys)
 
-        self.markers.set_color(self.current_recoil_element.color)
-        self.lines.set_color(self.current_recoil_element.color)
+        _set_line_color(self.markers, self.current_recoil_element.color)
+        _set_line_color(self.lines, self.current_recoil_element.color)
 
-        self.markers.set_visible(True)
-        self.lines.set_visible(True)
+        _set_artist_visible(self.markers, True)
+        _set_artist_visible(self.lines, True)
 
         if self.selected_points:  # If there are selected points
             self.coordinates_action.setVisible(True)
-            self.markers_selected.set_visible(True)
-            selected_xs = [p.get_x() for p in self.selected_points]
-            selected_ys = [p.get_y() for p in self.selected_points]
-            self.markers_selected.set_data(selected_xs, selected_ys)
+            _set_artist_visible(self.markers_selected, True)
+            selected_xs, selected_ys = \
+                _get_coordinate_array(self.selected_points).T
+            _set_line_data(self.markers_selected, selected_xs, selected_ys)
 
             if self.clicked_point is not None:
-                old_save_value = self.__save_points
-                self.__save_points = False
-                self.coordinates_widget.x_coord = self.clicked_point.get_x()
-                self.coordinates_widget.set_y_min(self.clicked_point)
-                self.coordinates_widget.y_coord = self.clicked_point.get_y()
-                self.__save_points = old_save_value
+                self.coordinates_widget.show_point(self.clicked_point)
                 # Disable y coordinate if it's zero and full edit is not on
                 if self.zero_point_selected():
                     if self.editing_restricted():
@@ -1896,54 +2197,84 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
                 else:
                     self.coordinates_widget.set_y_enabled(True)
         else:
-            self.markers_selected.set_data(
-                self.current_recoil_element.get_xs(),
-                self.current_recoil_element.get_ys()
-            )
-            self.markers_selected.set_visible(False)
+            _set_artist_visible(self.markers_selected, False)
             self.coordinates_action.setVisible(False)
 
         # Show all of recoil
+        limits_changed = False
         if self.__show_all_recoil:
             last_point = self.current_recoil_element.get_last_point()
             last_point_x = last_point.get_x()
             x_min, xmax = self.axes.get_xlim()
             if xmax < last_point_x:
                 self.axes.set_xlim(x_min, last_point_x + 0.04 * last_point_x)
-
-        self.fig.canvas.draw_idle()
+                limits_changed = True
+
+        if self.dragged_points:
+            # Area box is redrawn along with the distribution
+            self.__calculate_selected_area(redraw=False)
+        if self.dragged_points and not limits_changed:
+            self._blit_draw()
+        elif self.fig.stale:
+            # Matplotlib marks the figure stale whenever one of its artists
+            # changes, so a redraw is only needed if that has happened
+            self.fig.canvas.draw_idle()
 
     def update_layer_borders(self):
         """Update layer borders.
         """
-        for annotation in self.annotations:
-            annotation.set_visible(False)
-        self.annotations = []
         last_layer_thickness = 0
 
         y = 0.95
         next_layer_position = 0
         self.target_thickness = 0
+        # Corners of the background span of each layer. X coordinates are in
+        # data coordinates and y coordinates in axes coordinates.
+        span_verts = []
         for idx, layer in enumerate(self.target.layers):
             self.target_thickness += layer.thickness
-            self.axes.axvspan(
-                next_layer_position, next_layer_position + layer.thickness,
-                facecolor=self.layer_colors[idx % 2]
-            )
-
-            # Put annotation in the middle of the rectangular patch.
-            annotation = self.axes.text(
-                layer.start_depth, y, layer.name, transform=self.trans,
-                fontsize=10, ha="left")
+            end = next_layer_position + layer.thickness
+            span_verts.append([
+                (next_layer_position, 0), (next_layer_position, 1),
+                (end, 1), (end, 0)
+            ])
+
+            # Put annotation in the middle of the rectangular patch. Existing
+            # annotations are reused.
+            if idx < len(self.annotations):
+                annotation = self.annotations[idx]
+                annotation.set_position((layer.start_depth, y))
+                annotation.set_text(layer.name)
+                annotation.set_visible(True)
+            else:
+                annotation = self.axes.text(
+                    layer.start_depth, y, layer.name, transform=self.trans,
+                    fontsize=10, ha="left")
+                self.annotations.append(annotation)
             y -= 0.05
             if y <= 0.1:
                 y = 0.95
-            self.annotations.append(annotation)
             last_layer_thickness = layer.thickness
 
             # Move the position where the next layer starts.
             next_layer_position += layer.thickness
 
+        layer_count = len(self.target.layers)
+        for annotation in self.annotations[layer_count:]:
+            annotation.set_visible(False)
+
+        span_colors = [
+            self.layer_colors[idx % 2] for idx in range(layer_count)
+        ]
+        if self._layer_spans is None:
+            self._layer_spans = PolyCollection(
+                span_verts, facecolors=span_colors, edgecolors="none",
+                transform=self.axes.get_xaxis_transform())
+            self.axes.add_collection(self._layer_spans, autolim=False)
+        else:
+            self._layer_spans.set_verts(span_verts)
+            self._layer_spans.set_facecolor(span_colors)
+
         if self.original_x_limits:
             start = self.original_x_limits[0]
             end = self.original_x_limits[1]
@@ -1979,18 +2310,18 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
         Args:
             event: A MPL MouseEvent
         """
-        if self.current_element_simulation is None:
-            return
-        # Don't do anything if drag tool or zoom tool is active.
-        if self.__button_drag.isChecked() or self.__button_zoom.isChecked():
+        # Only if there are points being dragged. This is checked first as
+        # most motion events happen when the mouse is just hovering. Plain
+        # attribute checks are done before querying the toolbar buttons.
+        if not self.dragged_points or not len(self.click_locations):
             return
         # Only inside the actual graph axes, else do nothing.
-        if event.inaxes != self.axes:
+        if event.inaxes is not self.axes:
             return
-        # Only if there are points being dragged.
-        if not self.dragged_points:
+        if self.current_element_simulation is None:
             return
-        if not self.click_locations:
+        # Don't do anything if drag tool or zoom tool is active.
+        if self.__button_drag.isChecked() or self.__button_zoom.isChecked():
             return
 
         if self.__save_points:
@@ -1999,8 +2330,9 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
 
         dr_ps = self.dragged_points
 
+        minimum_concentration = self.get_minimum_concentration()
         new_coords = [
-            [x, max(self.get_minimum_concentration(), y)]
+            [x, max(minimum_concentration, y)]
             for x, y in self.get_new_checked_coordinates(event)
         ]
 
@@ -2040,87 +2372,57 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
             # Check that dragged point hasn't crossed with neighbors
             self.current_recoil_element.adjust_point(dr_ps[i], res=self.x_res)
 
-            self.__calculate_selected_area()
-
-        self.update_plot()
+        # Area is recalculated by the throttled redraw
+        if not self._drag_redraw_timer.isActive():
+            self._drag_redraw_timer.start()
 
     def get_new_checked_coordinates(self, event):
         """Returns checked new coordinates for dragged points.
         They have been checked for neighbor or axis limit collisions.
         """
-        # TODO needs refactor
-        dr_ps = self.dragged_points
-
-        leftmost_dr_p = dr_ps[0]
-        rightmost_dr_p = dr_ps[-1]
-        left_neighbor = self.current_recoil_element.get_left_neighbor(
-            leftmost_dr_p)
-        right_neighbor = self.current_recoil_element.get_right_neighbor(
-            rightmost_dr_p)
-
         new_coords = self.get_new_unchecked_coordinates(event)
 
-        if left_neighbor is None and right_neighbor is None:
-            pass  # No neighbors to limit movement
-        # Check for neighbor collisions:
-        elif left_neighbor is None and right_neighbor is not None:
-            if new_coords[-1][0] >= right_neighbor.get_x() - self.x_res:
-                new_coords[-1][0] = right_neighbor.get_x() - self.x_res
-                for i in range(0, len(dr_ps) - 1):
-                    new_coords[i][0] = right_neighbor.get_x() \
-                                       - self.x_res - self.x_dist_right[i]
-        elif right_neighbor is None and left_neighbor is not None:
-            if new_coords[0][0] <= left_neighbor.get_x() + self.x_res:
-                new_coords[0][0] = left_neighbor.get_x() + self.x_res
-                for i in range(1, len(dr_ps)):
-                    new_coords[i][0] = left_neighbor.get_x() + self.x_res \
-                                       + self.x_dist_left[i - 1]
-        elif left_neighbor.get_x() + self.x_res >= new_coords[0][0]:
-            new_coords[0][0] = left_neighbor.get_x() + self.x_res
-            for i in range(1, len(dr_ps)):
-                new_coords[i][0] = left_neighbor.get_x() + self.x_res \
-                                   + self.x_dist_left[i - 1]
-        elif right_neighbor.get_x() - self.x_res <= new_coords[-1][0]:
-            new_coords[-1][0] = right_neighbor.get_x() - self.x_res
-            for i in range(0, len(dr_ps) - 1):
-                new_coords[i][0] = right_neighbor.get_x() - self.x_res \
-                                   - self.x_dist_right[i]
+        # Check for neighbor collisions. Points are moved as a group so
+        # when one end collides, the rest keep their distances to it.
+        x_min, x_max = self.drag_x_limits
+        if x_min is not None and x_min >= new_coords[0, 0]:
+            self.__move_dragged_x_from_left(new_coords, x_min)
+        elif x_max is not None and x_max <= new_coords[-1, 0]:
+            self.__move_dragged_x_from_right(new_coords, x_max)
 
         # Check for axis limit collisions:
-        if new_coords[0][0] < 0:
-            new_coords[0][0] = 0
-            for i in range(1, len(dr_ps)):
-                new_coords[i][0] = self.x_dist_left[i - 1]
+        if new_coords[0, 0] < 0:
+            self.__move_dragged_x_from_left(new_coords, 0)
 
         # Check that y_min is not crossed
-        if not self.main_recoil_selected():
-            y_min = 0.0001
-        else:
-            if self.current_element_simulation.get_full_edit_on():
-                y_min = 0.0
-            else:
-                y_min = 0.0001
-        if new_coords[self.lowest_dr_p_i][1] < y_min:
-            new_coords[self.lowest_dr_p_i][1] = y_min
-            for i in range(0, len(dr_ps)):
-                new_coords[i][1] = y_min + self.y_dist_lowest[i]
-
-        return new_coords
-
-    def get_new_unchecked_coordinates(self, event):
-        """Returns new coordinates for dragged points.
-        These coordinates come from mouse movement and they haven't been checked
-        for neighbor or axis limit collisions.
-        """
-        new_unchecked_coords = []
-        for i, point in enumerate(self.dragged_points):
-            x0, y0, xclick, yclick = self.click_locations[i]
-            dx = event.xdata - xclick
-            dy = event.ydata - yclick
-            new_x = x0 + dx
-            new_y = y0 + dy
-            new_unchecked_coords.append([new_x, new_y])
-        return new_unchecked_coords
+        y_min = self.drag_y_min
+        if new_coords[self.lowest_dr_p_i, 1] < y_min:
+            new_coords[:, 1] = y_min + self.y_dist_lowest
+
+        return new_coords.tolist()
+
+    def __move_dragged_x_from_left(self, new_coords: np.ndarray, x: float):
+        """Moves the leftmost dragged point to x and the other points to
+        their original distances from it.
+        """
+        new_coords[0, 0] = x
+        new_coords[1:, 0] = x + self.x_dist_left
+
+    def __move_dragged_x_from_right(self, new_coords: np.ndarray, x: float):
+        """Moves the rightmost dragged point to x and the other points to
+        their original distances from it.
+        """
+        new_coords[-1, 0] = x
+        new_coords[:-1, 0] = x - self.x_dist_right
+
+    def get_new_unchecked_coordinates(self, event) -> np.ndarray:
+        """Returns new coordinates for dragged points as an array of shape
+        (n, 2). These coordinates come from mouse movement and they haven't
+        been checked for neighbor or axis limit collisions.
+        """
+        x_click, y_click = self.click_xy
+        return self.click_locations + (
+            event.xdata - x_click, event.ydata - y_click)
 
     def update_location(self, event):
         """Updates the location of points that are being dragged."""
@@ -2187,8 +2489,7 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
             # Make a backlog entry
             self.current_recoil_element.save_current_points(self.full_edit_on)
 
-            for sel_point in self.selected_points:
-                self.current_recoil_element.remove_point(sel_point)
+            self.current_recoil_element.remove_points(self.selected_points)
             self.selected_points.clear()
             self.update_plot()
 
@@ -2207,9 +2508,15 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
             return
         if event.button == 1:
             self.__x_end = event.xdata
+            dragged = bool(self.dragged_points)
             self.dragged_points.clear()
+            self._drag_redraw_timer.stop()
+            self._stop_blitting()
             self.__save_points = True
             self.update_plot()
+            if dragged:
+                # Points may have moved after the last throttled redraw
+                self.__calculate_selected_area()
 
             if self.point_clicked:
                 self.emit_distribution_change()
@@ -2244,7 +2551,7 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
         """
         self.clicked_point = None
         self.dragged_points = []
-        self.click_locations = []
+        self.click_locations = np.empty((0, 2))
         self.selected_points = []
         self.point_clicked = False
         self.coordinates_widget.setVisible(False)
@@ -2325,6 +2632,8 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
     def multiply_area(self):
         """Multiply recoil element area and change the distribution accordingly.
         """
+        from dialogs.simulation.multiply_area import MultiplyAreaDialog
+
         interval = self.get_main_interval()
         if interval is not None:
             low, high = interval.get_range()
@@ -2451,8 +2760,11 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
         self.axes.set_ybound(ylim[0], ylim[1])
         self.canvas.draw_idle()
 
-    def __calculate_selected_area(self) -> float:
+    def __calculate_selected_area(self, redraw: bool = True) -> float:
         """Calculate the recoil atom distribution's area inside limits.
+
+        Args:
+            redraw: whether the canvas is redrawn to show the new area
         """
         if not self.area_limits_individual_on:
             return 0.0
@@ -2463,21 +2775,26 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
 
         area = self.current_recoil_element.calculate_area(start=low, end=high)
 
-        if self.anchored_box:
-            self.anchored_box.set_visible(False)
-            self.anchored_box = None
-
         text = f"Area: {round(area, 2)}"
-        box = offsetbox.TextArea(
-            text, textprops=dict(color="k", size=12, backgroundcolor="w"))
-
-        self.anchored_box = offsetbox.AnchoredOffsetbox(
-            loc=1, child=box, pad=0.5, frameon=False,
-            bbox_to_anchor=(1.0, 1.0), bbox_transform=self.axes.transAxes,
-            borderpad=0.0,
-        )
-        self.axes.add_artist(self.anchored_box)
-        self.canvas.draw_idle()
+        # The box is created once and its text is updated afterwards
+        if self.anchored_box is None:
+            box = offsetbox.TextArea(
+                text, textprops=dict(color="k", size=12, backgroundcolor="w"))
+
+            self.anchored_box = offsetbox.AnchoredOffsetbox(
+                loc=1, child=box, pad=0.5, frameon=False,
+                bbox_to_anchor=(1.0, 1.0), bbox_transform=self.axes.transAxes,
+                borderpad=0.0,
+            )
+            # Box is blitted if it is created while points are dragged
+            self.anchored_box.set_animated(
+                self.lines is not None and self.lines.get_animated())
+            self.axes.add_artist(self.anchored_box)
+        else:
+            self.anchored_box.get_child().set_text(text)
+            self.anchored_box.set_visible(True)
+        if redraw:
+            self.canvas.draw_idle()
 
         return area
 
@@ -2506,10 +2823,10 @@ class RecoilAtomDistributionWidget(MatplotlibWidget):
             self.__context_menu(self.__rectangle_event_click)
             return
 
-        sel_points = []
-        for point in self.current_recoil_element.get_points():
-            if xmin <= point.get_x() <= xmax and ymin <= point.get_y() <= ymax:
-                sel_points.append(point)
+        points = self.current_recoil_element.get_points()
+        xs, ys = _get_coordinate_array(points).T
+        inside = (xmin <= xs) & (xs <= xmax) & (ymin <= ys) & (ys <= ymax)
+        sel_points = [points[i] for i in np.flatnonzero(inside)]
 
         self.selected_points = sel_points
         if sel_points:
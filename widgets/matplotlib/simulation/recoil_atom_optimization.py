@@ -42,6 +42,8 @@ from PyQt5.QtCore import pyqtSignal
 from widgets.matplotlib.base import MatplotlibWidget
 from widgets.simulation.point_coordinates import PointCoordinatesWidget
 
+_C_LOCALE = QLocale.c()
+
 
 class RecoilAtomOptimizationWidget(MatplotlibWidget):
     """
@@ -66,7 +68,7 @@ class RecoilAtomOptimizationWidget(MatplotlibWidget):
         self.parent = parent
         self.element_simulation = element_simulation
         self.target = target
-        self.locale = QLocale.c()
+        self.locale = _C_LOCALE
 
         self.trans = matplotlib.transforms.blended_transform_factory(
             self.axes.transData, self.axes.transAxes)
@@ -140,11 +142,15 @@ class RecoilAtomOptimizationWidget(MatplotlibWidget):
             self.show_recoils()
 
     def choose_recoil(self, button, checked):
-        if checked:
-            try:
-                self.current_recoil = button.recoil_element
-            except AttributeError:
-                return
+        # Switching recoils toggles two buttons. The one that is unchecked
+        # does not change the current recoil, so the plot is only updated
+        # once.
+        if not checked:
+            return
+        try:
+            self.current_recoil = button.recoil_element
+        except AttributeError:
+            return
 
         self.update_plot()
 
@@ -200,8 +206,7 @@ class RecoilAtomOptimizationWidget(MatplotlibWidget):
                     self.coordinates_widget.y_coordinate_box.setValue(
                         clicked_point.get_y())
 
-                    self.canvas.draw()
-                    self.canvas.flush_events()
+                    self.canvas.draw_idle()
 
     def on_draw(self):
         """
@@ -241,8 +246,7 @@ class RecoilAtomOptimizationWidget(MatplotlibWidget):
         # TODO next line may show a warning 'Tight layout not applied. The left
         #      and right margins cannot be made large enough to accommodate all
         #      axes decorations.'
-        self.canvas.draw()
-        self.canvas.flush_events()
+        mpl_utils.draw_idle_when_shown(self.canvas)
 
     def show_recoils(self):
         """
@@ -255,16 +259,17 @@ class RecoilAtomOptimizationWidget(MatplotlibWidget):
             btn.setEnabled(True)
             btn.recoil_element = recoil
             line, = self.axes.plot(recoil.get_xs(), recoil.get_ys(),
-                                   color=recoil.color)
+                                   color=recoil.color, markersize=10)
             self.lines[recoil] = line
 
         if self.element_simulation.optimization_recoils:
             self.move_results_btn.setEnabled(True)
             self.stop_optim_btn.setEnabled(False)
 
+        # Markers of the selected recoil are drawn by its own line. This line
+        # is never drawn, it is only used to check if a marker was clicked.
         self.selected_line, = self.axes.plot(
-            0, 0, marker="o", markersize=10, linestyle="None", zorder=15,
-            visible=False)
+            0, 0, marker="o", markersize=10, linestyle="None", visible=False)
         self.highlighted_marker, = self.axes.plot(
             0, 0, marker="o", markersize=10, linestyle="None", color="yellow",
             zorder=20, visible=False)
@@ -298,12 +303,12 @@ class RecoilAtomOptimizationWidget(MatplotlibWidget):
             if recoil == self.current_recoil:
                 line.set_alpha(1.0)
                 line.set_zorder(5)
+                line.set_marker("o")
                 self.selected_line.set_data(line.get_xdata(), line.get_ydata())
-                self.selected_line.set_color(line.get_color())
-                self.selected_line.set_visible(True)
             else:
                 line.set_alpha(0.3)
                 line.set_zorder(1)
+                line.set_marker("None")
 
         self.highlighted_marker.set_visible(False)
 
@@ -313,8 +318,7 @@ class RecoilAtomOptimizationWidget(MatplotlibWidget):
         if x_max < last_point_x:
             self.axes.set_xlim(x_min, last_point_x + 0.04 * last_point_x)
 
-        self.canvas.draw()
-        self.canvas.flush_events()
+        mpl_utils.draw_idle_when_shown(self.canvas)
 
     def _move_results(self, *_):
         """Moves the optimized results to regular recoils and closes the
@@ -340,7 +344,7 @@ class RecoilAtomParetoFront(MatplotlibWidget):
         self.axes.set_yscale("symlog")
         self.x_range = None, None
         self.y_range = None, None
-        self.home_btn = self.mpl_toolbar.children()[4]
+        self.home_btn = mpl_utils.get_toolbar_button(self.mpl_toolbar, "Home")
         _, self.drag_btn, self.zoom_btn = mpl_utils.get_toolbar_elements(
             self.mpl_toolbar,
             drag_callback=lambda: self.set_autoadjustment(False),
@@ -367,8 +371,7 @@ class RecoilAtomParetoFront(MatplotlibWidget):
             self.x_range = self.axes.get_xlim()
             self.y_range = self.axes.get_ylim()
 
-        self.canvas.draw()
-        self.canvas.flush_events()
+        mpl_utils.draw_idle_when_shown(self.canvas)
 
     def set_autoadjustment(self, b):
         self.automatic_readjustment = b
@@ -387,7 +387,8 @@ class MeasurementSettingsWidget(QtWidgets.QWidget,
         regex = "^[A-Za-z0-9-ÖöÄäÅå]*"
         valid_text = iv.validate_text_input(text, regex)
 
-        self.measurement_setting_file_name = valid_text
+        if valid_text != text:
+            self.measurement_setting_file_name = valid_text
 
     def __multiply_fluence(self):
         """Multiply fluence with clipboard's value.
@@ -245,7 +245,7 @@ class MeasurementTabWidget(BaseTab):
                 line_scale = lines[5].strip() == "True"
                 systerr = float(lines[6].strip())
             DepthProfileDialog.x_unit = x_unit
-            DepthProfileDialog.checked_cuts[m_name] = set(use_cuts)
+            DepthProfileDialog.set_checked_cuts(m_name, use_cuts)
             DepthProfileDialog.line_zero = line_zero
             DepthProfileDialog.line_scale = line_scale
             DepthProfileDialog.systerr = systerr
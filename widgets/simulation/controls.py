@@ -378,3 +378,93 @@ class SimulationControlsWidget(QtWidgets.QWidget, GUIObserver):
             if stylesheet is not None:
                 progress_bar.setStyleSheet(stylesheet)
         progress_bar.setValue(value)
+
+
+class LazySimulationControlsWidget(QtWidgets.QWidget, GUIObserver):
+    """Placeholder that creates a SimulationControlsWidget when it is shown
+    for the first time.
+
+    The placeholder observes the ElementSimulation until the controls are
+    created and replays the last message it received to them.
+    """
+
+    def __init__(self, element_simulation: ElementSimulation,
+                 recoil_dist_widget, settings_updated=None, **kwargs):
+        """Initializes a LazySimulationControlsWidget.
+
+        Args:
+            element_simulation: An ElementSimulation class object.
+            recoil_dist_widget: RecoilAtomDistributionWidget.
+            settings_updated: signal that indicates that settings have been
+                updated.
+            kwargs: keyword arguments passed down to SimulationControlsWidget
+        """
+        super().__init__()
+        GUIObserver.__init__(self)
+        self.element_simulation = element_simulation
+        self.controls: Optional[SimulationControlsWidget] = None
+        self._recoil_dist_widget = recoil_dist_widget
+        self._settings_updated = settings_updated
+        self._kwargs = kwargs
+        self._last_message = None
+
+        self.element_simulation.subscribe(self)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        if self._settings_updated is not None:
+            self._settings_updated[GlobalSettings].connect(
+                self._update_ion_settings)
+
+    def on_next_handler(self, status):
+        """Stores the status so that it can be replayed to the controls.
+        """
+        if self.controls is None:
+            self._last_message = "on_next_handler", status
+
+    def on_error_handler(self, err):
+        """Stores the error so that it can be replayed to the controls.
+        """
+        if self.controls is None:
+            self._last_message = "on_error_handler", err
+
+    @QtCore.pyqtSlot()
+    @QtCore.pyqtSlot(object)
+    def on_completed_handler(self, status=None):
+        """Stores the status so that it can be replayed to the controls.
+        """
+        if self.controls is None:
+            self._last_message = "on_completed_handler", status
+
+    def _update_ion_settings(self, settings: GlobalSettings):
+        """Stores updated ion settings so that they are used when the
+        controls are created.
+        """
+        if self.controls is not None:
+            return
+        self._kwargs["ion_division"] = settings.get_ion_division()
+        self._kwargs["min_presim_ions"] = settings.get_min_presim_ions()
+        self._kwargs["min_sim_ions"] = settings.get_min_simulation_ions()
+
+    def showEvent(self, event):
+        """Creates the SimulationControlsWidget before the placeholder is
+        shown for the first time.
+        """
+        if self.controls is None:
+            if self._settings_updated is not None:
+                try:
+                    self._settings_updated[GlobalSettings].disconnect(
+                        self._update_ion_settings)
+                except TypeError:
+                    pass
+            self.controls = SimulationControlsWidget(
+                self.element_simulation, self._recoil_dist_widget,
+                settings_updated=self._settings_updated, **self._kwargs)
+            self.layout().addWidget(self.controls)
+            self.element_simulation.unsubscribe(self)
+            if self._last_message is not None:
+                handler, msg = self._last_message
+                self._last_message = None
+                getattr(self.controls, handler)(msg)
+        super().showEvent(event)
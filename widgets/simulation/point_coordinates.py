@@ -29,6 +29,8 @@ import platform
 
 import widgets.binding as bnd
 
+from functools import partial
+
 from typing import Optional
 from modules.point import Point
 from dialogs.simulation.multiply_coordinate import MultiplyCoordinateDialog
@@ -84,7 +86,7 @@ class PointCoordinatesWidget(QtWidgets.QWidget):
             self.actionXMultiply = QtWidgets.QAction(self)
             self.actionXMultiply.setText("Multiply coordinate...")
             self.actionXMultiply.triggered.connect(
-                lambda: self.__multiply_coordinate(self.x_coordinate_box))
+                partial(self.__multiply_coordinate, self.x_coordinate_box))
             self.x_coordinate_box.addAction(self.actionXMultiply)
             self.set_x_enabled(False)
 
@@ -110,7 +112,7 @@ class PointCoordinatesWidget(QtWidgets.QWidget):
             self.actionYMultiply = QtWidgets.QAction(self)
             self.actionYMultiply.setText("Multiply coordinate...")
             self.actionYMultiply.triggered.connect(
-                lambda: self.__multiply_coordinate(self.y_coordinate_box))
+                partial(self.__multiply_coordinate, self.y_coordinate_box))
             self.y_coordinate_box.addAction(self.actionYMultiply)
 
             self.y_coordinate_box.editingFinished.connect(
@@ -168,6 +170,21 @@ class PointCoordinatesWidget(QtWidgets.QWidget):
         except AttributeError:
             self.y_coordinate_box.setMinimum(0.0)
 
+    def show_point(self, point: Point):
+        """Shows the coordinates of the given point in the spinboxes. Signals
+        from the spinboxes are blocked so that showing the coordinates does
+        not feed them back to the point.
+        """
+        x_blocked = self.x_coordinate_box.blockSignals(True)
+        y_blocked = self.y_coordinate_box.blockSignals(True)
+        try:
+            self.x_coord = point.get_x()
+            self.set_y_min(point)
+            self.y_coord = point.get_y()
+        finally:
+            self.x_coordinate_box.blockSignals(x_blocked)
+            self.y_coordinate_box.blockSignals(y_blocked)
+
     def set_x_enabled(self, b: bool):
         """Enables or disables x coordinate spinbox.
         """
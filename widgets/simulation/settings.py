@@ -45,10 +45,11 @@ from widgets.gui_utils import QtABCMeta
 from widgets.preset_widget import PresetWidget
 
 from PyQt5 import QtWidgets
-from PyQt5 import uic
 from PyQt5.QtCore import QLocale
 from PyQt5.QtCore import pyqtSignal
 
+_C_LOCALE = QLocale.c()
+
 
 class SimulationSettingsWidget(QtWidgets.QWidget, PropertyTrackingWidget,
                                PropertySavingWidget, metaclass=QtABCMeta):
@@ -88,7 +89,7 @@ class SimulationSettingsWidget(QtWidgets.QWidget, PropertyTrackingWidget,
             element_simulation: Element simulation object.
         """
         super().__init__()
-        uic.loadUi(
+        gutils.load_ui(
             gutils.get_ui_dir() / "ui_request_simulation_settings.ui", self)
 
         # By default, disable the widget, so caller has to enable it. Without
@@ -108,10 +109,10 @@ class SimulationSettingsWidget(QtWidgets.QWidget, PropertyTrackingWidget,
             lambda: iv.sanitize_file_name(self.nameLineEdit))
         self.nameLineEdit.setEnabled(False)
 
-        locale = QLocale.c()
-        self.minimumScatterAngleDoubleSpinBox.setLocale(locale)
-        self.minimumMainScatterAngleDoubleSpinBox.setLocale(locale)
-        self.minimumEnergyDoubleSpinBox.setLocale(locale)
+        for spin_box in (self.minimumScatterAngleDoubleSpinBox,
+                         self.minimumMainScatterAngleDoubleSpinBox,
+                         self.minimumEnergyDoubleSpinBox):
+            spin_box.setLocale(_C_LOCALE)
 
         self.__original_property_values = {}
 
@@ -194,18 +195,21 @@ class SimulationSettingsWidget(QtWidgets.QWidget, PropertyTrackingWidget,
         Update simulation settings.
         """
         params = self.get_properties()
-        self.element_simulation.name = params.pop("name")
-        self.element_simulation.description = params.pop("description")
+        element_simulation = self.element_simulation
+        element_simulation.name = params.pop("name")
+        element_simulation.description = params.pop("description")
         params.pop("modification_time")
 
-        if self.simulation_type != self.element_simulation.simulation_type:
-            if self.simulation_type == SimulationType.ERD:
+        # Property values were already read from the widgets above
+        simulation_type = params["simulation_type"]
+        if simulation_type != element_simulation.simulation_type:
+            if simulation_type == SimulationType.ERD:
                 new_type = "rec"
                 old_type = ".sct"
             else:
                 new_type = "sct"
                 old_type = ".rec"
-            for recoil in self.element_simulation.recoil_elements:
+            for recoil in element_simulation.recoil_elements:
                 recoil.type = new_type
                 # try:
                 #     path_to_rec = Path(self.element_simulation.directory,
@@ -213,7 +217,7 @@ class SimulationSettingsWidget(QtWidgets.QWidget, PropertyTrackingWidget,
                 #     os.remove(path_to_rec)
                 # except OSError:
                 #     pass
-                recoil.to_file(self.element_simulation.directory)
+                recoil.to_file(element_simulation.directory)
 
-        self.element_simulation.set_settings(**params)
+        element_simulation.set_settings(**params)
         self.settings_updated.emit()